@@ -1,5 +1,62 @@
-from .client import Spotify
-from .oauth2 import SpotifyCredentials
+"""Names are imported from their submodules on first use, so that
+``from aiospotipy import get_id`` does not import aiohttp."""
+import importlib
+
+_LAZY = {
+    'Spotify': 'client',
+    'SpotifyCredentials': 'oauth2',
+    'HedgePolicy': 'hedge',
+    'CircuitBreaker': 'breaker',
+    'CircuitOpen': 'breaker',
+    'deadline': '_http',
+    'RateLimiter': 'ratelimit',
+    'TTLCache': 'cache',
+    'RecommendationEngine': 'recommendations',
+    'DiscographyCrawler': 'crawler',
+    'CrawlItem': 'crawler',
+    'Library': 'library',
+    'ClientPool': 'pool',
+    'UserMe': 'pool',
+    'SearchEngine': 'search',
+    'TrackIndex': 'index',
+    'PlaylistFeed': 'feed',
+    'PlaylistChange': 'feed',
+    'RefreshAhead': 'refresh',
+    'RetryPolicy': 'retry',
+    'DecodePolicy': 'decode',
+    'SyncSpotify': 'sync',
+    'NDJSONSink': 'export',
+    'ParquetSink': 'export',
+    'ArrowSink': 'export',
+    'BulkExecutor': 'bulk',
+    'BulkResult': 'bulk',
+    'MemoryBudget': 'budget',
+    'AiohttpTransport': 'transport',
+    'HTTPXTransport': 'transport',
+    'TenantScheduler': 'tenants',
+    'QuotaExceeded': 'tenants',
+    'tenant': 'tenants',
+    'get_id': 'ids',
+    'get_ids': 'ids',
+    'get_uri': 'ids',
+    'IDSet': 'ids',
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __title__ = 'aiospotipy'
 __author__ = 'sizumita'
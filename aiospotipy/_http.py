@@ -1,36 +1,60 @@
 import logging
 import asyncio
 import aiohttp
+import contextlib
+import contextvars
+import functools
 import json
+import time
+
+from .endpoints import CATALOG, GET, POST, DELETE, PUT, Route, install, request_method  # noqa: F401
+from .budget import UNBUDGETED, current_reservation
+from .compression import ACCEPT_ENCODING, Bandwidth
+from .ids import get_id, get_uri  # noqa: F401
+from .ratelimit import RateLimiter
+from .transport import AiohttpTransport
 
 log = logging.getLogger(__name__)
-GET = "GET"
-POST = "POST"
-DELETE = "DELETE"
-PUT = "PUT"
 
 
-async def async_none():
-    return None
+class _Unlimited:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+_UNLIMITED = _Unlimited()
 
 
-def get_id(_type, _id):
-    fields = _id.split(':')
-    if len(fields) >= 3:
-        if _type != fields[-2]:
-            log.debug('expected id of type %s but found type %s %s', _type, fields[-2], _id)
-        return fields[-1]
-    fields = _id.split('/')
-    if len(fields) >= 3:
-        itype = fields[-2]
-        if _type != itype:
-            log.debug('expected id of type %s but found type %s %s', _type, itype, _id)
-        return fields[-1]
-    return _id
+_deadline = contextvars.ContextVar('aiospotipy_deadline', default=None)
 
 
-def get_uri(_type, _id):
-    return 'spotify:' + _type + ":" + get_id(_type, _id)
+@contextlib.contextmanager
+def deadline(seconds):
+    """Limits every request made inside the block, including retries and
+    following pages, to ``seconds`` in total.
+
+        with deadline(10):
+            page = await spotify.user_playlists('me')
+            while page:
+                page = await spotify.next(page)
+    """
+    until = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(until if current is None else min(current, until))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def make_timeout(timeout):
+    """Turns a number of seconds into an :class:`aiohttp.ClientTimeout`."""
+    if timeout is None or isinstance(timeout, aiohttp.ClientTimeout):
+        return timeout
+    return aiohttp.ClientTimeout(total=timeout)
 
 
 class SpotifyException(Exception):
@@ -49,414 +73,302 @@ class SpotifyException(Exception):
             self.http_status, self.code, self.msg)
 
 
-class Route:
-    BASE = 'https://api.spotify.com/v1'
+def _pick(_json, request_field):
+    if request_field and isinstance(_json, dict) and request_field in _json:
+        return _json[request_field]
+    return _json
+
 
-    def __init__(self, method, path, payload=None, **parameters):
-        self.payload = payload
-        self.path = path
-        self.method = method
-        self.params = {}
-        for key, value in parameters.items():
-            if value is None:
-                continue
-            self.params[key] = value
-        self.url = (self.BASE + self.path)
+def _resize_reservation(reservation, headers):
+    length = headers.get('Content-Length')
+    if length:
+        # a compressed body decodes to more than its Content-Length
+        length = int(length)
+        reservation.resize(length if 'Content-Encoding' not in headers else max(length, reservation.size))
+
+
+def _endpoint_name(route):
+    endpoint = route.template
+    return endpoint.name if endpoint is not None else route.family
 
 
 class HTTPClient:
     def __init__(self, auth=None, client_credentials_manager=None, connector=None, *, proxy=None, loop=None,
-                 timeout=30):
+                 timeout=30, hedge=None, breaker=None, retry=None, rate_limiter=None, cache=None, session=None,
+                 decoder=None, compress=True, memory_budget=None, transport=None, tenants=None):
         self.auth = auth
-        self.loop = asyncio.get_event_loop() if loop is None else loop
+        # unused, the running loop is used; kept for callers passing it
+        self.loop = loop
         self.client_credentials_manager = client_credentials_manager
         self.connector = connector
-        self.timeout = timeout
+        self.timeout = make_timeout(timeout)
         self.proxy = proxy
-
-    async def auth_headers(self):
-        token = self.client_credentials_manager.get_access_token() if not self.auth else self.auth
-        return {'Authorization': f'Bearer {token}'}
-
-    async def request(self, route, **kwargs) -> dict:
-        status_code, text, headers = None, None, None
+        self.hedge = hedge
+        self.breaker = breaker
+        self.retry = retry
+        self.decoder = decoder
+        self.compress = compress
+        self.accept_encoding = ACCEPT_ENCODING if compress else 'identity'
+        self.bandwidth = Bandwidth()
+        self.memory_budget = memory_budget
+        self.tenants = tenants
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.cache = cache
+        self.refresher = None
+        if transport is None:
+            transport = AiohttpTransport(connector, session, proxy)
+        elif connector is not None or session is not None or proxy is not None:
+            raise ValueError('connector, session and proxy only apply to the default transport, '
+                             'give them to the transport instead')
+        self.transport = transport
+
+    @property
+    def session(self):
+        """The :class:`aiohttp.ClientSession` of the default transport."""
+        return self.transport.session
+
+    async def close(self):
+        await self.transport.close()
+
+    async def auth_headers(self, auth=None):
+        """Returns the headers for ``auth``, a token or an object with a
+        ``get_access_token`` coroutine, or for the client's own credentials."""
+        if auth is None:
+            auth = self.auth or self.client_credentials_manager
+        token = auth if isinstance(auth, str) else await auth.get_access_token()
+        return {'Authorization': 'Bearer ' + token, 'Content-Type': 'application/json'}
+
+    async def _send(self, method, url, headers, args, name):
+        reservation = current_reservation()
+        on_headers = None if reservation is None else functools.partial(_resize_reservation, reservation)
+        async with self.rate_limiter:
+            r = await self.transport.request(method, url, headers, on_headers=on_headers, **args)
+        self.bandwidth.record(name, r.wire, len(r.body))
+        if self.tenants is not None:
+            self.tenants.record(r.wire, len(r.body))
+        if reservation is not None:
+            reservation.resize(len(r.body))
+            reservation.budget.record(name, len(r.body))
+        return r.status, r.body.decode(r.charset or 'utf-8'), r.headers
+
+    def _timeout_for(self, timeout):
+        timeout = self.timeout if timeout is None else make_timeout(timeout)
+        until = _deadline.get()
+        if until is None:
+            return timeout
+        remaining = until - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        if timeout is None:
+            return aiohttp.ClientTimeout(total=remaining)
+        if timeout.total is not None and timeout.total <= remaining:
+            return timeout
+        return aiohttp.ClientTimeout(total=remaining, connect=timeout.connect,
+                                     sock_read=timeout.sock_read, sock_connect=timeout.sock_connect)
+
+    def cache_key(self, route):
+        """Returns the response cache key of ``route``, or None if its
+        response must not be shared between callers."""
+        if self.cache is None or route.endpoint is None or not route.endpoint.cacheable:
+            return None
+        params = route.params
+        if 'from_token' in params.values():
+            return None
+        return route.url, tuple(sorted(params.items())) if params else ()
+
+    async def fetch(self, route, timeout=None, auth=None, headers=None):
+        """|coro|
+        sends ``route`` through the retry policy, circuit breaker, hedging
+        and rate limiter and returns the raw ``(status, text, headers)`` of
+        the response, without checking the status. The caller holds the
+        tenant quota slot, see :meth:`admit`.
+
+        Parameters:
+            - route - the :class:`Route` to send
+            - timeout - the total seconds allowed for each attempt
+            - auth - the token to send instead of the client's own
+            - headers - extra request headers
+        """
+        if self.retry is None:
+            return await self._attempt(route, timeout, auth, headers)
+        return await self.retry.run(route, lambda: self._attempt(route, timeout, auth, headers),
+                                    lambda: self._snapshot(route, auth))
+
+    async def _snapshot(self, route, auth):
+        """Returns the snapshot_id of the playlist whose tracks ``route`` changes."""
+        snapshot = Route(GET, route.path.rsplit('/', 1)[0], fields='snapshot_id')
+        status_code, text, headers = await self._attempt(snapshot, None, auth, None)
+        self.raise_for_status(snapshot.url, status_code, text, headers)
+        return json.loads(text)['snapshot_id']
+
+    async def _attempt(self, route, timeout, auth, headers):
         method = route.method
         url = route.url
         payload = route.payload
         args = dict(params=route.params)
-        args["timeout"] = self.timeout
-        request_field = kwargs.get('request_field', None)
-        _headers = await self.auth_headers()
-        _headers['Content-Type'] = 'application/json'
+        timeout = self._timeout_for(timeout)
+        if timeout is not None:
+            args["timeout"] = timeout
+        _headers = await self.auth_headers(auth)
+        _headers['Accept-Encoding'] = self.accept_encoding
+        if headers:
+            _headers.update(headers)
         if payload:
             args["data"] = json.dumps(payload)
-        async with aiohttp.ClientSession() as session:
-            if method == GET:
-                async with session.get(url, headers=_headers, proxy=self.proxy, **args) as r:
-                    text = await r.text()
-                    status_code = r.status
-                    headers = r.headers
-
-            elif method == POST:
-                async with session.post(url, headers=headers, verify=True,
-                                        proxy=self.proxy, **args) as r:
-                    text = await r.text()
-                    status_code = r.status
-                    headers = r.headers
-
-            elif method == DELETE:
-                async with session.delete(url, **args) as r:
-                    text = await r.text()
-                    status_code = r.status
-                    headers = r.headers
-
-            elif method == PUT:
-                async with session.put(url, **args) as r:
-                    text = await r.text()
-                    status_code = r.status
-                    headers = r.headers
-            await session.close()
-
-        if not 200 <= status_code and not status_code < 300:
+        name = _endpoint_name(route)
+        send = functools.partial(self._send, method, url, _headers, args, name)
+        breaker = self.breaker
+        if breaker is not None:
+            family = route.family
+            breaker.before(family)
+        try:
+            if self.hedge is not None and method == GET:
+                status_code, text, headers = await self.hedge.run(send)
+            else:
+                status_code, text, headers = await send()
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            if breaker is not None:
+                breaker.failure(family)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release(family)
+            raise
+        if breaker is not None:
+            if status_code >= 500:
+                breaker.failure(family)
+            else:
+                breaker.success(family)
+
+        if status_code == 429:
+            self.rate_limiter.pause(float(headers.get('Retry-After', 1)))
+        return status_code, text, headers
+
+    @staticmethod
+    def raise_for_status(url, status_code, text, headers):
+        if not 200 <= status_code < 300:
+            message = 'error'
             if text and len(text) > 0 and text != 'null':
-                raise SpotifyException(status_code,
-                                       -1, '%s:\n %s' % (url, json.loads(text)['error']['message']),
-                                       headers=headers)
+                # gateways answer 5xx with HTML, not a Spotify error object
+                try:
+                    message = json.loads(text)['error']['message']
+                except (ValueError, KeyError, TypeError):
+                    message = text
+            raise SpotifyException(status_code, -1, '%s:\n %s' % (url, message), headers=headers)
+
+    async def decode(self, text):
+        """|coro|
+        decodes a JSON response body, with the decode policy if there is one
+        """
+        if self.decoder is None:
+            return json.loads(text)
+        return await self.decoder.decode(text)
+
+    def admit(self):
+        """Returns the tenant quota slot of a request, to be held with
+        ``async with`` around its memory budget reservation so a request
+        waiting for its tenant's quota holds no budget bytes."""
+        if self.tenants is None:
+            return _UNLIMITED
+        return self.tenants.admit()
+
+    def reserve(self, route):
+        """Returns the memory budget reservation of a request of ``route``,
+        to be held with ``async with`` until its response is decoded."""
+        if self.memory_budget is None:
+            return UNBUDGETED
+        return self.memory_budget.reserve(_endpoint_name(route))
+
+    async def _load(self, route, timeout, auth, key):
+        async with self.admit(), self.reserve(route):
+            status_code, text, headers = await self.fetch(route, timeout, auth)
+            self.raise_for_status(route.url, status_code, text, headers)
+            if text and len(text) > 0 and text != 'null':
+                _json = await self.decode(text)
+                if key is not None:
+                    self.cache.set(key, _json)
+                return _json
             else:
-                raise SpotifyException(status_code, -1, '%s:\n %s' % (url, 'error'), headers=headers)
-        if text and len(text) > 0 and text != 'null':
-            _json = json.loads(text)
-            if request_field and request_field in _json.keys():
-                return _json[request_field]
-            return _json
-        else:
-            return {}
+                return {}
 
-    async def next(self, result):
+    async def request(self, route, timeout=None, auth=None, **kwargs) -> dict:
+        request_field = kwargs.get('request_field', None)
+        if request_field is None and route.endpoint is not None:
+            request_field = route.endpoint.field
+        key = self.cache_key(route)
+        if key is not None:
+            _json = self.cache.get(key)
+            if _json is not None:
+                if self.refresher is not None:
+                    self.refresher.touch(key, route)
+                return _pick(_json, request_field)
+        return _pick(await self._load(route, timeout, auth, key), request_field)
+
+    async def refresh(self, route, timeout=None):
+        """|coro|
+        sends ``route`` without looking in the response cache and caches the
+        response if the endpoint is cacheable.
+        """
+        return await self._load(route, timeout, None, self.cache_key(route))
+
+    async def request_if_changed(self, route, etag=None, timeout=None, auth=None):
+        """|coro|
+        sends ``route`` with ``If-None-Match: etag`` and returns
+        ``(etag, response)``, where ``response`` is None if the resource has
+        not changed since ``etag`` was returned.
+
+        The response cache is not used, a conditional request is already
+        cheap when nothing changed.
+        """
+        headers = {'If-None-Match': etag} if etag else None
+        async with self.admit(), self.reserve(route):
+            status_code, text, _headers = await self.fetch(route, timeout, auth, headers)
+            if status_code == 304:
+                return etag, None
+            self.raise_for_status(route.url, status_code, text, _headers)
+            _json = await self.decode(text) if text and text != 'null' else {}
+            return _headers.get('ETag'), _json
+
+    async def next(self, result, timeout=None):
         if result['next']:
             r = Route(GET, result['next'])
 
-            return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
+            return await self.request(r, timeout=timeout)
         else:
-            return async_none()
+            return None
 
-    async def previous(self, result):
+    async def previous(self, result, timeout=None):
         if result['previous']:
             r = Route(GET, result['previous'])
 
-            return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
+            return await self.request(r, timeout=timeout)
         else:
-            return async_none()
-
-    async def track(self, track_id):
-        trid = get_id('track', track_id)
-        r = Route(GET, '/tracks/' + trid)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def tracks(self, tracks, market):
-        tlist = [get_id('track', t) for t in tracks]
-        r = Route(GET, '/tracks/?ids=' + ','.join(tlist), market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def artist(self, artist_id):
-        trid = get_id('artist', artist_id)
-        r = Route(GET, '/artists/' + trid)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def artists(self, artists):
-        tlist = [get_id('artist', a) for a in artists]
-        r = Route(GET, '/artists/?ids=' + ','.join(tlist))
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def artist_albums(self, artist_id, album_type, country, limit, offset):
-        trid = get_id('artist', artist_id)
-        r = Route(GET, f'/artists/{trid}/albums',
-                  album_type=album_type, country=country, limit=limit, offset=offset)
+            return None
 
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def artist_top_tracks(self, artist_id, country):
-        trid = get_id('artist', artist_id)
-        r = Route(GET, f'/artists/{trid}/top-tracks', country=country)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def artist_related_artists(self, artist_id):
-        trid = get_id('artist', artist_id)
-        r = Route(GET, f'/artists/{trid}/related-artists')
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def album(self, album_id):
-        trid = get_id('album', album_id)
-        r = Route(GET, 'albums/' + trid)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def album_tracks(self, album_id, limit, offset):
-        trid = get_id('album', album_id)
-        r = Route(GET,
-                  f'albums/{trid}/tracks/',
-                  limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def albums(self, albums):
-        tlist = [get_id('album', a) for a in albums]
-        r = Route(GET, 'albums/?ids=' + ','.join(tlist))
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def search(self, q, limit, offset, _type, market):
-        r = Route(GET,
-                  '/search/',
-                  q=q, limit=limit, offset=offset, type=_type, market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def search_artist(self, q, limit, offset, market):
-        r = Route(GET,
-                  '/search/',
-                  q=q, limit=limit, offset=offset, type="artist", market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def search_album(self, q, limit, offset, market):
-        r = Route(GET,
-                  '/search/',
-                  q=q, limit=limit, offset=offset, type="album", market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def search_track(self, q, limit, offset, market):
-        r = Route(GET,
-                  '/search/',
-                  q=q, limit=limit, offset=offset, type="track", market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def search_playlist(self, q, limit, offset, market):
-        r = Route(GET,
-                  '/search/',
-                  q=q, limit=limit, offset=offset, type="playlist", market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def user(self, user):
-        r = Route(GET, '/users/' + user)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def user_playlists(self, user, limit, offset):
-        r = Route(GET,
-                  f"/users/{user}/playlists",
-                  limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def user_playlist(self, user, playlist_id, fields):
+    async def user_playlist(self, user, playlist_id=None, fields=None, timeout=None):
         if not playlist_id:
             r = Route(GET, f"/users/{user}/starred", fields=fields)
         else:
-            plid = get_id('playlist', playlist_id)
-            r = Route(GET,
-                      f"/users/{user}/playlists/{plid}",
-                      fields=fields)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def get_playlist_tracks(self, user, playlist_id, fields, limit, offset, market):
-        plid = get_id('playlist', playlist_id)
-        r = Route(GET,
-                  f"/users/{user}/playlists/{plid}/tracks",
-                  limit=limit, offset=offset, fields=fields, market=market)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def playlist_create(self, user, name, public):
-        data = {'name': name, 'public': public}
-        r = Route(POST,
-                  f"/users/{user}/playlists",
-                  payload=data)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def playlist_change_details(self, user, playlist_id, name, public, collaborative):
-        data = {}
-
-        if isinstance(name, str):
-            data['name'] = name
-        if isinstance(public, bool):
-            data['public'] = public
-        if isinstance(collaborative, bool):
-            data['collaborative'] = collaborative
-        r = Route(PUT,
-                  f"/users/{user}/playlists/{playlist_id}",
-                  payload=data)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def unfollow_playlist(self, user, playlist_id):
-        r = Route(DELETE,
-                  f"/users/{user}/playlists/{playlist_id}/followers")
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def playlist_add_tracks(self, user, _playlist_id, tracks, position):
-        playlist_id = get_id('playlist', _playlist_id)
-        ftracks = [get_uri('track', tid) for tid in tracks]
-        r = Route(POST,
-                  f"/users/{user}/playlists/{playlist_id}/tracks",
-                  payload=ftracks, position=position)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def playlist_replace_tracks(self, user, _playlist_id, _tracks):
-        playlist_id = get_id('playlist', _playlist_id)
-        tracks = [get_uri('track', tid) for tid in _tracks]
-        payload = {"uris": tracks}
-        r = Route(PUT,
-                  f"/users/{user}/playlists/{playlist_id}/tracks",
-                  payload=payload)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def playlist_reorder_tracks(self, user, _playlist_id, range_start, insert_before, range_length,
-                                      snapshot_id):
-        playlist_id = get_id('playlist', _playlist_id)
-        payload = {"range_start": range_start,
-                   "range_length": range_length,
-                   "insert_before": insert_before}
-        if snapshot_id:
-            payload["snapshot_id"] = snapshot_id
-        r = Route(PUT,
-                  f"/users/{user}/playlists/{playlist_id}/tracks",
-                  payload=payload)
+            r = CATALOG['user_playlist'].route(user, playlist_id, fields)
 
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
+        return await self.request(r, timeout=timeout)
 
-    async def user_playlist_remove_tracks(self, user, _playlist_id, _tracks, mode, snapshot_id):
-        playlist_id = get_id('playlist', _playlist_id)
+    async def playlist_remove_tracks(self, user, playlist_id, tracks, mode="all", snapshot_id=None, timeout=None):
         if mode == "all":
-            tracks = [get_uri('track', tid) for tid in _tracks]
-            payload = {"tracks": [{"uri": track} for track in tracks]}
-            if snapshot_id:
-                payload["snapshot_id"] = snapshot_id
+            payload = {"tracks": [{"uri": get_uri('track', tid)} for tid in tracks]}
         elif mode == "specific":
-            tracks = []
-            for tr in _tracks:
-                tracks.append({
-                    "uri": get_uri("track", tr["uri"]),
-                    "positions": tr["positions"],
-                })
-            payload = {"tracks": tracks}
-            if snapshot_id:
-                payload["snapshot_id"] = snapshot_id
+            payload = {"tracks": [{"uri": get_uri("track", tr["uri"]), "positions": tr["positions"]}
+                                  for tr in tracks]}
         else:
             raise LookupError("mode must be all or specific")
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
 
-        r = Route(DELETE,
-                  f"/users/{user}/playlists/{playlist_id}/tracks",
-                  payload=payload)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def get_playlist_follower(self, playlist_owner_id, playlist_id):
-        r = Route(PUT,
-                  f"/users/{playlist_owner_id}/playlists/{playlist_id}/followers")
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def user_playlist_is_following(self, playlist_owner_id, playlist_id, user_ids):
-        r = Route(GET,
-                  "/users/{}/playlists/{}/followers/contains?ids={}"
-                  .format(playlist_owner_id, playlist_id, ','.join(user_ids)))
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def featured_playlists(self, locale, country, timestamp, limit, offset):
-        r = Route(GET, '/browse/featured-playlists',
-                  locale=locale, country=country, timestamp=timestamp, limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def new_releases(self, country, limit, offset):
-        r = Route(GET,
-                  '/browse/new-releases',
-                  country=country, limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def categories(self, country, locale, limit, offset):
-        r = Route(GET,
-                  '/browse/categories',
-                  country=country, locale=locale, limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def category_playlists(self, category_id, country, limit, offset):
-        r = Route(GET,
-                  '/browse/categories/' + category_id + '/playlists',
-                  country=country, limit=limit, offset=offset)
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def recommendations(self, seed_artists, seed_genres, seed_tracks, limit, country, **kwargs):
-        params = dict(limit=limit)
-        if seed_artists:
-            params['seed_artists'] = ','.join(
-                [get_id('artist', a) for a in seed_artists])
-        if seed_genres:
-            params['seed_genres'] = ','.join(seed_genres)
-        if seed_tracks:
-            params['seed_tracks'] = ','.join(
-                [get_id('track', t) for t in seed_tracks])
-        if country:
-            params['market'] = country
-
-        for attribute in ["acousticness", "danceability", "duration_ms",
-                          "energy", "instrumentalness", "key", "liveness",
-                          "loudness", "mode", "popularity", "speechiness",
-                          "tempo", "time_signature", "valence"]:
-            for prefix in ["min_", "max_", "target_"]:
-                param = prefix + attribute
-                if param in kwargs:
-                    params[param] = kwargs[param]
-        r = Route(GET, '/recommendations', **params)
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def recommendation_genre_seeds(self):
-        r = Route(GET, '/recommendations/available-genre-seeds')
-
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def audio_analysis(self, track_id):
-        trid = get_id('track', track_id)
-        r = Route(GET, f'/audio-analysis/{trid}')
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-
-    async def audio_features(self, tracks):
-        if tracks is None:
-            tracks = []
-        if isinstance(tracks, str):
-            trackid = get_id('track', tracks)
-            r = Route(GET, f'/audio-features/?ids={trackid}')
-
-            return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
-        else:
-            # the response has changed, look for the new style first, and if
-            # its not there, fallback on the old style
-            tlist = [get_id('track', t) for t in tracks]
-            r = Route(GET,
-                      '/audio-features/?ids=' + ','.join(tlist))
+        r = CATALOG['playlist_remove_tracks'].make({'user': user, 'playlist_id': playlist_id}, payload=payload)
 
-            return await asyncio.wait_for(self.request(r, request_field='audio_features'), self.timeout, loop=self.loop)
+        return await self.request(r, timeout=timeout)
 
-    async def audio_analyses(self, track_ids):
-        ids = get_id('track', track_ids)
-        r = Route(GET, f'/audio-analysis/{ids}')
 
-        return await asyncio.wait_for(self.request(r), self.timeout, loop=self.loop)
+install(HTTPClient, CATALOG, request_method)
+HTTPClient.user_playlist_remove_tracks = HTTPClient.playlist_remove_tracks
+HTTPClient.user_playlist_is_following = HTTPClient.playlist_is_following
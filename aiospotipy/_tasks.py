@@ -0,0 +1,50 @@
+import asyncio
+
+
+async def bounded_map(func, items, concurrency):
+    """Calls ``func(item)`` for every item with at most ``concurrency`` calls
+    running at once, and yields ``(index, result, error)`` as calls finish.
+
+    ``items`` is consumed lazily, so it can be a generator of any length. If
+    the consumer stops early, the running calls are cancelled.
+    """
+    items = enumerate(items)
+    queue = asyncio.Queue()
+    tasks = set()
+    # calls started whose result has not been yielded yet
+    outstanding = 0
+
+    async def run(index, item):
+        try:
+            result = await func(item)
+        except asyncio.CancelledError as e:
+            # keeps the consumer from waiting for a result that never comes
+            queue.put_nowait((index, None, e))
+            raise
+        except Exception as e:
+            queue.put_nowait((index, None, e))
+        else:
+            queue.put_nowait((index, result, None))
+
+    def start():
+        nonlocal outstanding
+        while outstanding < concurrency:
+            try:
+                index, item = next(items)
+            except StopIteration:
+                return
+            task = asyncio.ensure_future(run(index, item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            outstanding += 1
+
+    try:
+        start()
+        while outstanding:
+            result = await queue.get()
+            outstanding -= 1
+            start()
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,120 @@
+import collections
+import time
+
+from ._http import SpotifyException
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpen(SpotifyException):
+    """Raised instead of sending a request while the circuit of its endpoint
+    family is open."""
+
+    def __init__(self, family, retry_after):
+        super().__init__(None, -1, 'circuit for %s is open, retry in %.1fs' % (family, retry_after),
+                         headers={'Retry-After': str(int(retry_after + 0.999))})
+        self.family = family
+        self.retry_after = retry_after
+
+
+class _Circuit:
+    __slots__ = ('state', 'failures', 'opened_at', 'probes', 'opened', 'rejected')
+
+    def __init__(self, threshold):
+        self.state = CLOSED
+        self.failures = collections.deque(maxlen=threshold)
+        self.opened_at = None
+        self.probes = 0
+        self.opened = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast while an endpoint family is unhealthy.
+
+    Each endpoint family (see ``Route.family``) has its own circuit, so a
+    sick family does not hold up the others.
+
+    Parameters:
+        - failure_threshold - the number of failures that opens the circuit
+        - window - the failures must happen within this many seconds
+        - recovery_timeout - how long the circuit stays open before probing
+        - half_open_max - how many probe requests may run at once
+    """
+
+    def __init__(self, failure_threshold=5, window=10.0, recovery_timeout=30.0, half_open_max=1):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max = half_open_max
+        self._circuits = {}
+
+    def _circuit(self, family):
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(self.failure_threshold)
+        return circuit
+
+    def before(self, family):
+        """Raises :class:`CircuitOpen` if a request to ``family`` must not be sent."""
+        circuit = self._circuit(family)
+        if circuit.state == CLOSED:
+            return
+        if circuit.state == OPEN:
+            remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                circuit.rejected += 1
+                raise CircuitOpen(family, remaining)
+            circuit.state = HALF_OPEN
+        if circuit.probes >= self.half_open_max:
+            circuit.rejected += 1
+            raise CircuitOpen(family, 0)
+        circuit.probes += 1
+
+    def success(self, family):
+        circuit = self._circuit(family)
+        if circuit.state == HALF_OPEN:
+            circuit.state = CLOSED
+            circuit.probes = 0
+            circuit.failures.clear()
+
+    def failure(self, family):
+        circuit = self._circuit(family)
+        now = time.monotonic()
+        if circuit.state == HALF_OPEN:
+            self._open(circuit, now)
+            return
+        circuit.failures.append(now)
+        if (len(circuit.failures) >= self.failure_threshold
+                and now - circuit.failures[0] <= self.window):
+            self._open(circuit, now)
+
+    def release(self, family):
+        """Gives back a probe slot for a request that ended without an answer."""
+        circuit = self._circuit(family)
+        if circuit.state == HALF_OPEN and circuit.probes:
+            circuit.probes -= 1
+
+    @staticmethod
+    def _open(circuit, now):
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.probes = 0
+        circuit.opened += 1
+        circuit.failures.clear()
+
+    def state(self, family=None):
+        """Returns the state of one family, or a dict of every family's state."""
+        if family is not None:
+            return self._circuit(family).state
+        return {
+            name: {
+                'state': circuit.state,
+                'recent_failures': len(circuit.failures),
+                'opened': circuit.opened,
+                'rejected': circuit.rejected,
+            }
+            for name, circuit in self._circuits.items()
+        }
@@ -0,0 +1,143 @@
+import asyncio
+import collections
+import contextvars
+
+_reservation = contextvars.ContextVar('aiospotipy_reservation', default=None)
+
+
+def current_reservation():
+    """Returns the :class:`Reservation` of the request being made, if any."""
+    return _reservation.get()
+
+
+class Reservation:
+    """The bytes a request holds in a :class:`MemoryBudget` from before it
+    is sent until its response has been decoded."""
+
+    __slots__ = ('budget', 'name', 'size', '_token')
+
+    def __init__(self, budget, name, size):
+        self.budget = budget
+        self.name = name
+        self.size = size
+        self._token = None
+
+    def resize(self, size):
+        """Replaces the estimate with a better one, e.g. the Content-Length
+        of the response, without waiting for room."""
+        self.budget._resize(self, size)
+
+    async def __aenter__(self):
+        await self.budget._acquire(self.size)
+        self._token = _reservation.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        _reservation.reset(self._token)
+        self.budget._release(self.size)
+
+
+class _Unbudgeted:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+UNBUDGETED = _Unbudgeted()
+
+
+class MemoryBudget:
+    """Bounds the response bytes being received or waiting to be decoded.
+
+    A request reserves the running average response size of its endpoint
+    before it is sent, and waits in line while the budget has no room for
+    it. The reservation is corrected from ``Content-Length`` when the
+    response arrives and from the decoded size once it is read, and
+    released once the response is decoded. A request larger than the whole
+    budget is let through when nothing else is in flight.
+
+    Parameters:
+        - max_bytes - the most bytes reserved at once
+        - default_estimate - the bytes reserved for an endpoint with no
+          response seen yet
+        - smoothing - the weight of the newest response in the average
+    """
+
+    def __init__(self, max_bytes=64 * 2 ** 20, default_estimate=64 * 2 ** 10, smoothing=0.2):
+        self.max_bytes = max_bytes
+        self.default_estimate = default_estimate
+        self.smoothing = smoothing
+        self.used = 0
+        self.peak = 0
+        self.waits = 0
+        self._averages = {}
+        self._waiters = collections.deque()
+
+    def estimate(self, name):
+        return int(self._averages.get(name, self.default_estimate))
+
+    def record(self, name, size):
+        """Adds the decoded size of a response of endpoint ``name`` to its average."""
+        average = self._averages.get(name)
+        self._averages[name] = size if average is None else average + self.smoothing * (size - average)
+
+    def reserve(self, name):
+        """Returns the :class:`Reservation` of a request to endpoint ``name``,
+        to be used with ``async with``."""
+        return Reservation(self, name, self.estimate(name))
+
+    def _fits(self, size):
+        return self.used == 0 or self.used + size <= self.max_bytes
+
+    async def _acquire(self, size):
+        if not self._waiters and self._fits(size):
+            self._take(size)
+            return
+        self.waits += 1
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future, size)
+        self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(size)
+            else:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._wake()
+            raise
+
+    def _take(self, size):
+        self.used += size
+        if self.used > self.peak:
+            self.peak = self.used
+
+    def _release(self, size):
+        self.used -= size
+        self._wake()
+
+    def _resize(self, reservation, size):
+        self._take(size - reservation.size)
+        reservation.size = size
+        self._wake()
+
+    def _wake(self):
+        waiters = self._waiters
+        while waiters and self._fits(waiters[0][1]):
+            future, size = waiters.popleft()
+            if not future.done():
+                self._take(size)
+                future.set_result(None)
+
+    def stats(self):
+        return {
+            'used': self.used,
+            'max_bytes': self.max_bytes,
+            'peak': self.peak,
+            'waiting': len(self._waiters),
+            'waits': self.waits,
+            'estimates': {name: int(average) for name, average in self._averages.items()},
+        }
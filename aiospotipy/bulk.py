@@ -0,0 +1,116 @@
+import asyncio
+import collections
+import time
+
+from ._http import deadline
+from ._tasks import bounded_map
+from .endpoints import Route
+from .transport import _TotalTimeout
+
+BulkResult = collections.namedtuple('BulkResult', 'index result error')
+BulkResult.__doc__ = """The outcome of one call of a bulk run: ``result`` is its
+response and ``error`` None, or ``error`` is the exception it raised."""
+
+
+class _Run:
+    """The state of one :meth:`BulkExecutor.run`."""
+
+    __slots__ = ('until', 'cancelled', 'running')
+
+    def __init__(self, until):
+        self.until = until
+        self.cancelled = False
+        self.running = set()
+
+    def cancel(self):
+        self.cancelled = True
+        for task in list(self.running):
+            task.cancel()
+
+
+class BulkExecutor:
+    """Runs many unrelated calls at once and streams back their results,
+    failures included, as they complete.
+
+    A call is a :class:`Route`, a tuple of an :class:`HTTPClient` method
+    name and its arguments, e.g. ``('artist_top_tracks', artist_id)``, or
+    a function returning an awaitable, e.g.
+    ``functools.partial(spotify.user, 'spotify')``.
+
+        async for index, result, error in BulkExecutor(spotify.http).run(calls, deadline=30):
+            ...
+
+    Parameters:
+        - http - the :class:`HTTPClient` the calls are sent with, its rate
+          limiter applies to them
+        - concurrency - the most calls running at once
+    """
+
+    def __init__(self, http, concurrency=16):
+        self.http = http
+        self.concurrency = concurrency
+        self._runs = set()
+
+    def _call(self, call):
+        if isinstance(call, Route):
+            return self.http.request(call)
+        if isinstance(call, tuple):
+            return getattr(self.http, call[0])(*call[1:])
+        return call()
+
+    async def _run_one(self, call, run):
+        if run.cancelled:
+            raise asyncio.CancelledError()
+        task = asyncio.current_task()
+        run.running.add(task)
+        try:
+            if run.until is None:
+                return await self._call(call)
+            remaining = run.until - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            # the deadline bounds the requests, the timer a call awaiting
+            # something else; each call already runs in its own task
+            with deadline(remaining), _TotalTimeout(remaining):
+                return await self._call(call)
+        finally:
+            run.running.discard(task)
+
+    async def run(self, calls, deadline=None):
+        """Yields a :class:`BulkResult` for every call as it completes.
+
+        A call that fails yields its exception instead of stopping the run.
+        Calls not finished ``deadline`` seconds after the run started fail
+        with :class:`asyncio.TimeoutError`, and calls cancelled with
+        :meth:`cancel` with :class:`asyncio.CancelledError`. Stopping the
+        iteration cancels the calls still running.
+
+        Parameters:
+            - calls - the calls to make, see :class:`BulkExecutor`
+            - deadline - the most seconds the whole run may take
+        """
+        run = _Run(None if deadline is None else time.monotonic() + deadline)
+        self._runs.add(run)
+        try:
+            async for index, result, error in bounded_map(lambda call: self._run_one(call, run), calls,
+                                                          self.concurrency):
+                yield BulkResult(index, result, error)
+        finally:
+            self._runs.discard(run)
+
+    def cancel(self):
+        """Cancels the calls running and fails the calls not started yet,
+        in every run in progress. Runs started later are not affected."""
+        for run in list(self._runs):
+            run.cancel()
+
+    async def gather(self, calls, deadline=None):
+        """|coro|
+        Runs the calls like :meth:`run` and returns a list of their results,
+        or of the exception raised, in the order of ``calls``.
+        """
+        calls = list(calls)
+        results = [None] * len(calls)
+        async for index, result, error in self.run(calls, deadline):
+            results[index] = result if error is None else error
+        return results
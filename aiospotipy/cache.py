@@ -0,0 +1,67 @@
+import collections
+import time
+
+
+class TTLCache:
+    """A least recently used cache whose entries expire after ``ttl`` seconds.
+
+    Parameters:
+        - maxsize - the most entries kept
+        - ttl - the default lifetime of an entry in seconds
+    """
+
+    def __init__(self, maxsize=4096, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def expires(self, key):
+        """Returns the :func:`time.monotonic` time ``key`` expires at, or None
+        if it is not cached. Does not count as a use of the entry."""
+        entry = self._data.get(key)
+        return None if entry is None else entry[0]
+
+    def set(self, key, value, ttl=None):
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def setdefault(self, key, value, ttl=None):
+        """Returns the cached value for ``key``, caching ``value`` if there is none."""
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._data.move_to_end(key)
+            return entry[1]
+        self.set(key, value, ttl)
+        return value
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
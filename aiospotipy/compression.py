@@ -0,0 +1,61 @@
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+
+def decompress(body, encoding):
+    """Returns ``body`` decoded from its ``Content-Encoding``."""
+    encoding = (encoding or '').strip().lower()
+    if not encoding or encoding == 'identity':
+        return body
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == 'br' and brotli is not None:
+        return brotli.decompress(body)
+    raise ValueError('unsupported Content-Encoding %r' % encoding)
+
+
+class Bandwidth:
+    """Counts the bytes received per endpoint, as sent over the wire and
+    after decompression."""
+
+    def __init__(self):
+        self._counters = {}
+
+    def record(self, name, wire, decoded):
+        counters = self._counters.get(name)
+        if counters is None:
+            counters = self._counters[name] = [0, 0, 0]
+        counters[0] += 1
+        counters[1] += wire
+        counters[2] += decoded
+
+    def stats(self):
+        """Returns ``{endpoint: {'responses', 'wire_bytes', 'decoded_bytes',
+        'ratio'}}``, ``ratio`` being wire bytes per decoded byte."""
+        return {
+            name: {
+                'responses': responses,
+                'wire_bytes': wire,
+                'decoded_bytes': decoded,
+                'ratio': wire / decoded if decoded else None,
+            }
+            for name, (responses, wire, decoded) in self._counters.items()
+        }
+
+    def clear(self):
+        self._counters.clear()
@@ -0,0 +1,195 @@
+import asyncio
+import base64
+import collections
+import json
+import os
+import time
+
+from .ids import IDSet
+
+CrawlItem = collections.namedtuple('CrawlItem', 'kind id depth data')
+CrawlItem.__doc__ = """One result of a crawl.
+
+``kind`` is ``'artist'`` (``data`` is the artist object), ``'album'`` (the
+full album object), ``'album_tracks'`` (a list of tracks of the album that
+did not fit in the album object) or ``'error'`` (the exception raised while
+fetching ``id``).
+"""
+
+_DONE = object()
+
+
+class DiscographyCrawler:
+    """Walks the related artist graph breadth first from seed artists and
+    fetches every artist's albums and tracks.
+
+    Parameters:
+        - http - the :class:`HTTPClient` to send requests with
+        - max_depth - how many related artist hops to follow, 0 for only
+          the seeds
+        - concurrency - the number of workers sending requests
+        - album_type - the album types to fetch, e.g. ``'album,single'``
+        - country - An ISO 3166-1 alpha-2 country code.
+        - checkpoint - a file the crawl state is saved to and resumed from
+        - checkpoint_interval - the most seconds between two saves
+    """
+
+    def __init__(self, http, max_depth=1, concurrency=8, album_type=None, country=None,
+                 checkpoint=None, checkpoint_interval=30):
+        self.http = http
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.album_type = album_type
+        self.country = country
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.artists = IDSet(_type='artist')
+        self.albums = IDSet(_type='album')
+        self._jobs = None
+        self._out = None
+        # jobs running or with items not yielded yet, by key, and how many
+        # of those holds each has; they are fetched again on resume
+        self._active = {}
+        self._holds = collections.Counter()
+        self._album_buffer = []
+        self._saved_at = 0
+
+    async def crawl(self, seed_artists):
+        """Yields a :class:`CrawlItem` for everything fetched, as soon as it
+        is fetched. If a checkpoint file exists, the crawl resumes from it
+        and ``seed_artists`` is ignored; items being fetched or not yielded
+        yet when it was saved are fetched again."""
+        self._jobs = asyncio.Queue()
+        self._out = asyncio.Queue(maxsize=self.concurrency * 4)
+        if not self._load():
+            for artist_id in seed_artists:
+                if self.artists.add(artist_id):
+                    self._jobs.put_nowait(('artist', artist_id, 0))
+
+        workers = [asyncio.ensure_future(self._worker()) for _ in range(self.concurrency)]
+        supervisor = asyncio.ensure_future(self._supervise())
+        done = False
+        try:
+            while True:
+                key, item = await self._out.get()
+                if item is _DONE:
+                    done = True
+                    break
+                yield item
+                self._release(key)
+                self._maybe_save()
+        finally:
+            if not done:
+                self._maybe_save(force=True)
+            supervisor.cancel()
+            for worker in workers:
+                worker.cancel()
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    async def _supervise(self):
+        await self._jobs.join()
+        await self._out.put((None, _DONE))
+
+    async def _worker(self):
+        while True:
+            job = await self._jobs.get()
+            key = id(job)
+            self._active[key] = job
+            self._holds[key] += 1
+            try:
+                await getattr(self, '_' + job[0])(key, *job[1:])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await self._put(key, CrawlItem('error', job[1], job[-1], e))
+            finally:
+                self._release(key)
+                if self._album_buffer and self._jobs.empty():
+                    self._flush_albums(all_albums=True)
+                self._jobs.task_done()
+
+    async def _put(self, key, item):
+        self._holds[key] += 1
+        await self._out.put((key, item))
+
+    def _release(self, key):
+        self._holds[key] -= 1
+        if not self._holds[key]:
+            del self._holds[key]
+            del self._active[key]
+
+    def _flush_albums(self, all_albums=False):
+        buffer = self._album_buffer
+        while len(buffer) >= 20 or (all_albums and buffer):
+            chunk, buffer[:20] = buffer[:20], []
+            self._jobs.put_nowait(('albums', chunk, chunk[0][1]))
+
+    async def _artist(self, key, artist_id, depth):
+        artist = await self.http.artist(artist_id)
+        await self._put(key, CrawlItem('artist', artist_id, depth, artist))
+        self._jobs.put_nowait(('artist_albums', artist_id, depth))
+        if depth < self.max_depth:
+            related = await self.http.artist_related_artists(artist_id)
+            for other in related['artists']:
+                if self.artists.add(other['id']):
+                    self._jobs.put_nowait(('artist', other['id'], depth + 1))
+
+    async def _artist_albums(self, key, artist_id, depth):
+        page = await self.http.artist_albums(artist_id, album_type=self.album_type, country=self.country, limit=50)
+        while page:
+            for album in page['items']:
+                if self.albums.add(album['id']):
+                    self._album_buffer.append((album['id'], depth))
+            self._flush_albums()
+            page = await self.http.next(page)
+
+    async def _albums(self, key, chunk, depth):
+        result = await self.http.albums([album_id for album_id, _ in chunk])
+        for album, (album_id, album_depth) in zip(result['albums'], chunk):
+            if album is None:
+                continue
+            await self._put(key, CrawlItem('album', album_id, album_depth, album))
+            tracks = album.get('tracks') or {}
+            if tracks.get('next'):
+                self._jobs.put_nowait(('album_tracks', album_id, len(tracks['items']), album_depth))
+
+    async def _album_tracks(self, key, album_id, offset, depth):
+        page = await self.http.album_tracks(album_id, limit=50, offset=offset)
+        while page:
+            await self._put(key, CrawlItem('album_tracks', album_id, depth, page['items']))
+            page = await self.http.next(page)
+
+    def _maybe_save(self, force=False):
+        if self.checkpoint is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._saved_at < self.checkpoint_interval:
+            return
+        self._saved_at = now
+        state = {
+            'jobs': list(self._active.values()) + list(self._jobs._queue),
+            'album_buffer': self._album_buffer,
+            'artists': base64.b64encode(self.artists.to_bytes()).decode(),
+            'albums': base64.b64encode(self.albums.to_bytes()).decode(),
+        }
+        tmp = self.checkpoint + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.checkpoint)
+
+    def _load(self):
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return False
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        self.artists = IDSet.from_bytes(base64.b64decode(state['artists']), _type='artist')
+        self.albums = IDSet.from_bytes(base64.b64decode(state['albums']), _type='album')
+        self._album_buffer = [tuple(album) for album in state['album_buffer']]
+        for job in state['jobs']:
+            if job[0] == 'albums':
+                job = ('albums', [tuple(album) for album in job[1]], job[2])
+            self._jobs.put_nowait(tuple(job))
+        if self._album_buffer and self._jobs.empty():
+            self._flush_albums(all_albums=True)
+        return True
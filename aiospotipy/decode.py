@@ -0,0 +1,70 @@
+import asyncio
+import json
+import time
+
+
+class DecodePolicy:
+    """Decodes small JSON bodies on the event loop and large ones in an
+    executor, and measures how long decoding blocks the loop.
+
+    ``json.loads`` holds the GIL while it parses, so with a thread pool the
+    loop still waits for most of a large decode. A
+    :class:`concurrent.futures.ProcessPoolExecutor` frees the loop, at the
+    cost of copying the body and the decoded object between processes;
+    compare ``inline_seconds_per_mb`` with the lag seen with each to choose
+    the executor and the threshold.
+
+    Parameters:
+        - threshold - bodies of at least this many characters are decoded
+          in the executor
+        - executor - the executor to decode in, None for the loop's default
+          one
+        - loads - the function decoding a body, it must be picklable to be
+          used with a process pool
+    """
+
+    def __init__(self, threshold=256 * 1024, executor=None, loads=json.loads):
+        self.threshold = threshold
+        self.executor = executor
+        self.loads = loads
+        self.inline = 0
+        self.inline_bytes = 0
+        self.blocked = 0.0
+        self.max_blocked = 0.0
+        self.offloaded = 0
+        self.offloaded_bytes = 0
+        self.offloaded_seconds = 0.0
+
+    async def decode(self, text):
+        size = len(text)
+        if size < self.threshold:
+            start = time.perf_counter()
+            result = self.loads(text)
+            elapsed = time.perf_counter() - start
+            self.inline += 1
+            self.inline_bytes += size
+            self.blocked += elapsed
+            if elapsed > self.max_blocked:
+                self.max_blocked = elapsed
+            return result
+        start = time.perf_counter()
+        result = await asyncio.get_running_loop().run_in_executor(self.executor, self.loads, text)
+        self.offloaded += 1
+        self.offloaded_bytes += size
+        self.offloaded_seconds += time.perf_counter() - start
+        return result
+
+    def stats(self):
+        """Returns the decode counters. ``blocked`` is the total seconds the
+        loop spent decoding inline and ``max_blocked`` the longest single
+        decode."""
+        return {
+            'inline': self.inline,
+            'inline_bytes': self.inline_bytes,
+            'blocked': self.blocked,
+            'max_blocked': self.max_blocked,
+            'inline_seconds_per_mb': self.blocked / self.inline_bytes * 2 ** 20 if self.inline_bytes else None,
+            'offloaded': self.offloaded,
+            'offloaded_bytes': self.offloaded_bytes,
+            'offloaded_seconds': self.offloaded_seconds,
+        }
@@ -0,0 +1,799 @@
+import inspect
+import re
+import string
+
+from .ids import get_id, get_uri
+
+GET = "GET"
+POST = "POST"
+DELETE = "DELETE"
+PUT = "PUT"
+
+_REQUIRED = object()
+_UNMATCHED = object()
+
+TUNABLE_ATTRIBUTES = frozenset(
+    prefix + attribute
+    for attribute in ["acousticness", "danceability", "duration_ms",
+                      "energy", "instrumentalness", "key", "liveness",
+                      "loudness", "mode", "popularity", "speechiness",
+                      "tempo", "time_signature", "valence"]
+    for prefix in ["min_", "max_", "target_"]
+)
+
+
+class Route:
+    BASE = 'https://api.spotify.com/v1'
+    endpoint = None
+    _template = _UNMATCHED
+
+    def __init__(self, method, path, payload=None, **parameters):
+        self.payload = payload
+        self.path = path
+        self.method = method
+        self.params = {}
+        for key, value in parameters.items():
+            if value is None:
+                continue
+            self.params[key] = value
+        self.url = self.path if self.path.startswith('https://') else (self.BASE + self.path)
+
+    @classmethod
+    def compiled(cls, endpoint, path, params, payload):
+        """Builds a route for ``endpoint`` whose path and params are already final."""
+        self = cls.__new__(cls)
+        self.method = endpoint.method
+        self.path = path
+        self.url = cls.BASE + path
+        self.params = params
+        self.payload = payload
+        self.endpoint = endpoint
+        return self
+
+    @property
+    def template(self):
+        """The :class:`Endpoint` of this route, or for a route built from a
+        URL, e.g. the next page of a paging object, the endpoint whose path
+        template and method match it; None if none does."""
+        if self.endpoint is not None:
+            return self.endpoint
+        if self._template is _UNMATCHED:
+            path = self.path[len(self.BASE):] if self.path.startswith(self.BASE) else self.path
+            self._template = _match(self.method, path.split('?', 1)[0])
+        return self._template
+
+    @property
+    def family(self):
+        """The endpoint family of this route, see :attr:`Endpoint.family`,
+        or the first segment of its path if it matches no endpoint."""
+        endpoint = self.template
+        if endpoint is not None:
+            return endpoint.family
+        path = self.path[len(self.BASE):] if self.path.startswith(self.BASE) else self.path
+        return path.lstrip('/').split('/', 1)[0].split('?', 1)[0]
+
+
+def _family(path):
+    """Returns the family of a path template, its segments without the
+    parameters (``'users/playlists/tracks'`` for
+    ``/users/{user}/playlists/{playlist_id}/tracks``)."""
+    return '/'.join([segment for segment in path.strip('/').split('/') if '{' not in segment])
+
+
+_PATTERNS = []
+
+
+def _match(method, path):
+    """Returns the endpoint whose path template and method match a path."""
+    if not _PATTERNS:
+        for endpoint in (*CATALOG.values(), *ME.values()):
+            pattern = re.sub(r'\\{\w+\\}', '[^/]+', re.escape(endpoint.path))
+            _PATTERNS.append((re.compile(pattern), endpoint))
+    for pattern, endpoint in _PATTERNS:
+        if endpoint.method == method and pattern.fullmatch(path):
+            return endpoint
+    return None
+
+
+def _join(_type, value, convert):
+    if isinstance(value, str):
+        return convert(_type, value)
+    return ','.join([convert(_type, v) for v in value])
+
+
+class Endpoint:
+    """Describes one Spotify Web API endpoint.
+
+    Parameters:
+        - name - the method name generated for the endpoint
+        - method - the HTTP method
+        - path - the path template, e.g. ``'/artists/{artist_id}/albums'``
+        - args - the method arguments in order, either a name or a
+          ``(name, default)`` pair
+        - ids - maps an argument to the Spotify type its IDs are normalized to
+        - uris - maps an argument to the Spotify type its URIs are built for
+        - query - the arguments sent as query parameters
+        - body - the arguments sent in the JSON payload
+        - alias - maps an argument to its name on the wire
+        - const - query parameters that are always sent
+        - extra - names accepted as extra keyword arguments and sent as query
+          parameters
+        - batch - ``(argument, limit)``, the most IDs one request accepts
+        - paging - ``'offset'``, ``'cursor'`` or None
+        - family - the circuit breaker family, by default the path template
+          without its parameters
+        - cacheable - whether the response may be cached for other callers
+        - idempotent - whether the request may be safely repeated
+        - field - the response field to return instead of the whole body
+        - doc - the docstring of the generated methods
+    """
+
+    def __init__(self, name, method, path, args=(), *, ids=None, uris=None, query=(), body=(), alias=None,
+                 const=None, extra=frozenset(), batch=None, paging=None, family=None, cacheable=False,
+                 idempotent=None, field=None, doc=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.ids = ids or {}
+        self.uris = uris or {}
+        self.batch = batch
+        self.paging = paging
+        self.cacheable = cacheable and method == GET
+        self.idempotent = method != POST if idempotent is None else idempotent
+        self.field = field
+        self.doc = inspect.cleandoc(doc) if doc else None
+        self.extra = extra
+        self.family = _family(path) if family is None else family
+
+        self.names = tuple(a if isinstance(a, str) else a[0] for a in args)
+        self._defaults = {a: _REQUIRED for a in args if isinstance(a, str)}
+        self._defaults.update(a for a in args if not isinstance(a, str))
+        self._required = tuple(a for a in args if isinstance(a, str))
+
+        alias = alias or {}
+        self._segments = []
+        for literal, field_name, _, _ in string.Formatter().parse(path):
+            if field_name is not None and field_name not in self._defaults:
+                raise ValueError('%s: unknown path argument %s' % (name, field_name))
+            self._segments.append((literal, field_name, self.ids.get(field_name)))
+        self._query = tuple((a, alias.get(a, a), self.ids.get(a)) for a in query)
+        self._body = tuple((a, alias.get(a, a), self.uris.get(a)) for a in body)
+        self._const = dict(const or {})
+
+    def __repr__(self):
+        return '<Endpoint %s %s %s>' % (self.name, self.method, self.path)
+
+    def signature(self):
+        parameters = [inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        for name in self.names:
+            default = self._defaults[name]
+            parameters.append(inspect.Parameter(
+                name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=inspect.Parameter.empty if default is _REQUIRED else default))
+        if self.extra:
+            parameters.append(inspect.Parameter('kwargs', inspect.Parameter.VAR_KEYWORD))
+        return inspect.Signature(parameters)
+
+    def bind(self, args, kwargs):
+        """Returns a dict of every argument value, defaults included."""
+        if len(args) > len(self.names):
+            raise TypeError('%s() takes %d positional arguments but %d were given'
+                            % (self.name, len(self.names), len(args)))
+        values = self._defaults.copy()
+        values.update(zip(self.names, args))
+        if kwargs:
+            for key in kwargs:
+                if key not in values and key not in self.extra:
+                    raise TypeError('%s() got an unexpected keyword argument %r' % (self.name, key))
+            values.update(kwargs)
+        for name in self._required:
+            if values[name] is _REQUIRED:
+                raise TypeError('%s() missing required argument: %r' % (self.name, name))
+        return values
+
+    def make(self, values, params=None, payload=None):
+        """Builds a route from the path arguments in ``values`` and ready-made params and payload."""
+        path = ''.join([
+            literal if name is None else
+            literal + (get_id(_type, values[name]) if _type else str(values[name]))
+            for literal, name, _type in self._segments
+        ])
+        return Route.compiled(self, path, {} if params is None else params, payload)
+
+    def route(self, *args, **kwargs):
+        """Builds the :class:`Route` for a call with the given arguments."""
+        values = self.bind(args, kwargs)
+        params = self._const.copy()
+        for name, wire, _type in self._query:
+            value = values[name]
+            if value is None:
+                continue
+            if _type is not None:
+                value = _join(_type, value, get_id)
+            elif isinstance(value, (list, tuple)):
+                value = ','.join(value)
+            params[wire] = value
+        if self.extra:
+            for name in self.extra.intersection(values):
+                if values[name] is not None:
+                    params[name] = values[name]
+        payload = None
+        if self._body:
+            payload = {}
+            for name, wire, _type in self._body:
+                value = values[name]
+                if value is None:
+                    continue
+                if _type is not None:
+                    value = [get_uri(_type, v) for v in value]
+                payload[wire] = value
+        return self.make(values, params, payload)
+
+
+def request_method(endpoint):
+    """Builds a method sending ``endpoint`` through ``self.request``."""
+    route = endpoint.route
+
+    async def method(self, *args, timeout=None, **kwargs):
+        return await self.request(route(*args, **kwargs), timeout=timeout)
+
+    return _named(method, endpoint)
+
+
+def delegate_method(endpoint):
+    """Builds a method awaiting the method of the same name on ``self.http``."""
+    name = endpoint.name
+
+    async def method(self, *args, **kwargs):
+        return await getattr(self.http, name)(*args, **kwargs)
+
+    return _named(method, endpoint)
+
+
+def _named(method, endpoint):
+    method.__name__ = endpoint.name
+    method.__signature__ = endpoint.signature()
+    if endpoint.doc:
+        method.__doc__ = '|coro|\n' + endpoint.doc
+    method.endpoint = endpoint
+    return method
+
+
+def install(cls, endpoints, factory):
+    """Adds a method built by ``factory`` to ``cls`` for every endpoint it
+    does not implement itself."""
+    for endpoint in endpoints.values():
+        if endpoint.name not in cls.__dict__:
+            method = factory(endpoint)
+            method.__module__ = cls.__module__
+            method.__qualname__ = cls.__qualname__ + '.' + endpoint.name
+            setattr(cls, endpoint.name, method)
+
+
+def _table(*endpoints):
+    return {endpoint.name: endpoint for endpoint in endpoints}
+
+
+_SEARCH_ARGS = ('q', ('limit', 10), ('offset', 0), ('market', None))
+_SEARCH_DOC = """
+    searches for {}
+
+    Parameters:
+        - q - the search query
+        - limit  - the number of items to return
+        - offset - the index of the first item to return
+        - market - An ISO 3166-1 alpha-2 country code or the string from_token.
+    """
+_BROWSE_DOC = """
+                 - limit - The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50
+
+                 - offset - The index of the first item to return. Default: 0
+                   (the first object). Use with limit to get the next set of
+                   items.
+"""
+
+CATALOG = _table(
+    Endpoint('track', GET, '/tracks/{track_id}', ('track_id',),
+             ids={'track_id': 'track'}, cacheable=True,
+             doc="""
+             returns a single track given the track's ID, URI or URL
+
+             Parameters:
+                 - track_id - a spotify URI, URL or ID
+             """),
+    Endpoint('tracks', GET, '/tracks', ('tracks', ('market', None)),
+             ids={'tracks': 'track'}, query=('tracks', 'market'), alias={'tracks': 'ids'},
+             batch=('tracks', 50), cacheable=True,
+             doc="""
+             returns a list of tracks given a list of track IDs, URIs, or URLs
+
+             Parameters:
+                 - tracks - a list of spotify URIs, URLs or IDs
+                 - market - an ISO 3166-1 alpha-2 country code.
+             """),
+    Endpoint('artist', GET, '/artists/{artist_id}', ('artist_id',),
+             ids={'artist_id': 'artist'}, cacheable=True,
+             doc="""
+             returns a single artist given the artist's ID, URI or URL
+
+             Parameters:
+                 - artist_id - an artist ID, URI or URL
+             """),
+    Endpoint('artists', GET, '/artists', ('artists',),
+             ids={'artists': 'artist'}, query=('artists',), alias={'artists': 'ids'},
+             batch=('artists', 50), cacheable=True,
+             doc="""
+             returns a list of artists given the artist IDs, URIs, or URLs
+
+             Parameters:
+                 - artists - a list of  artist IDs, URIs or URLs
+             """),
+    Endpoint('artist_albums', GET, '/artists/{artist_id}/albums',
+             ('artist_id', ('album_type', None), ('country', None), ('limit', 20), ('offset', 0)),
+             ids={'artist_id': 'artist'}, query=('album_type', 'country', 'limit', 'offset'),
+             paging='offset', cacheable=True,
+             doc="""
+             Get Spotify catalog information about an artist's albums
+
+             Parameters:
+                 - artist_id - the artist ID, URI or URL
+                 - album_type - 'album', 'single', 'appears_on', 'compilation'
+                 - country - limit the response to one particular country.
+                 - limit  - the number of albums to return
+                 - offset - the index of the first album to return
+             """),
+    Endpoint('artist_top_tracks', GET, '/artists/{artist_id}/top-tracks', ('artist_id', ('country', 'US')),
+             ids={'artist_id': 'artist'}, query=('country',), cacheable=True,
+             doc="""
+             Get Spotify catalog information about an artist's top 10 tracks
+                 by country.
+
+             Parameters:
+                 - artist_id - the artist ID, URI or URL
+                 - country - limit the response to one particular country.
+             """),
+    Endpoint('artist_related_artists', GET, '/artists/{artist_id}/related-artists', ('artist_id',),
+             ids={'artist_id': 'artist'}, cacheable=True,
+             doc="""
+             Get Spotify catalog information about artists similar to an
+                 identified artist. Similarity is based on analysis of the
+                 Spotify community's listening history.
+
+             Parameters:
+                 - artist_id - the artist ID, URI or URL
+             """),
+    Endpoint('album', GET, '/albums/{album_id}', ('album_id',),
+             ids={'album_id': 'album'}, cacheable=True,
+             doc="""
+             returns a single album given the album's ID, URIs or URL
+
+             Parameters:
+                 - album_id - the album ID, URI or URL
+             """),
+    Endpoint('album_tracks', GET, '/albums/{album_id}/tracks', ('album_id', ('limit', 50), ('offset', 0)),
+             ids={'album_id': 'album'}, query=('limit', 'offset'), paging='offset', cacheable=True,
+             doc="""
+             Get Spotify catalog information about an album's tracks
+
+             Parameters:
+                 - album_id - the album ID, URI or URL
+                 - limit  - the number of items to return
+                 - offset - the index of the first item to return
+             """),
+    Endpoint('albums', GET, '/albums', ('albums',),
+             ids={'albums': 'album'}, query=('albums',), alias={'albums': 'ids'},
+             batch=('albums', 20), cacheable=True,
+             doc="""
+             returns a list of albums given the album IDs, URIs, or URLs
+
+             Parameters:
+                 - albums - a list of  album IDs, URIs or URLs
+             """),
+    Endpoint('search', GET, '/search', ('q', ('limit', 10), ('offset', 0), ('_type', 'track'), ('market', None)),
+             query=('q', 'limit', 'offset', '_type', 'market'), alias={'_type': 'type'},
+             paging='offset', cacheable=True,
+             doc="""
+             searches for an item
+
+             Parameters:
+                 - q - the search query
+                 - limit  - the number of items to return
+                 - offset - the index of the first item to return
+                 - type - the type of item to return. One of 'artist', 'album',
+                          'track' or 'playlist'
+                 - market - An ISO 3166-1 alpha-2 country code or the string from_token.
+             """),
+    Endpoint('search_artist', GET, '/search', _SEARCH_ARGS, query=('q', 'limit', 'offset', 'market'),
+             const={'type': 'artist'}, paging='offset', cacheable=True, doc=_SEARCH_DOC.format('an artist')),
+    Endpoint('search_album', GET, '/search', _SEARCH_ARGS, query=('q', 'limit', 'offset', 'market'),
+             const={'type': 'album'}, paging='offset', cacheable=True, doc=_SEARCH_DOC.format('an album')),
+    Endpoint('search_track', GET, '/search', _SEARCH_ARGS, query=('q', 'limit', 'offset', 'market'),
+             const={'type': 'track'}, paging='offset', cacheable=True, doc=_SEARCH_DOC.format('a track')),
+    Endpoint('search_playlist', GET, '/search', _SEARCH_ARGS, query=('q', 'limit', 'offset', 'market'),
+             const={'type': 'playlist'}, paging='offset', cacheable=True, doc=_SEARCH_DOC.format('a playlist')),
+    Endpoint('user', GET, '/users/{user}', ('user',), cacheable=True,
+             doc="""
+             Gets basic profile information about a Spotify User
+
+             Parameters:
+                 - user - the id of the usr
+             """),
+    Endpoint('user_playlists', GET, '/users/{user}/playlists', ('user', ('limit', 50), ('offset', 0)),
+             query=('limit', 'offset'), paging='offset',
+             doc="""
+             Gets playlists of a user
+
+             Parameters:
+                 - user - the id of the usr
+                 - limit  - the number of items to return
+                 - offset - the index of the first item to return
+             """),
+    Endpoint('user_playlist', GET, '/users/{user}/playlists/{playlist_id}',
+             ('user', ('playlist_id', None), ('fields', None)),
+             ids={'playlist_id': 'playlist'}, query=('fields',),
+             doc="""
+             Gets playlist of a user
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - fields - which fields to return
+             """),
+    Endpoint('get_playlist_tracks', GET, '/users/{user}/playlists/{playlist_id}/tracks',
+             ('user', 'playlist_id', ('fields', None), ('limit', 100), ('offset', 0), ('market', None)),
+             ids={'playlist_id': 'playlist'}, query=('fields', 'limit', 'offset', 'market'), paging='offset',
+             doc="""
+             Get full details of the tracks of a playlist owned by a user.
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - fields - which fields to return
+                 - limit - the maximum number of tracks to return
+                 - offset - the index of the first track to return
+                 - market - an ISO 3166-1 alpha-2 country code.
+             """),
+    Endpoint('playlist_create', POST, '/users/{user}/playlists', ('user', 'name', ('public', True)),
+             body=('name', 'public'),
+             doc="""
+             Creates a playlist for a user
+
+             Parameters:
+                 - user - the id of the user
+                 - name - the name of the playlist
+                 - public - is the created playlist public
+             """),
+    Endpoint('playlist_change_details', PUT, '/users/{user}/playlists/{playlist_id}',
+             ('user', 'playlist_id', ('name', None), ('public', None), ('collaborative', None)),
+             ids={'playlist_id': 'playlist'}, body=('name', 'public', 'collaborative'),
+             doc="""
+             Changes a playlist's name and/or public/private state
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - name - optional name of the playlist
+                 - public - optional is the playlist public
+                 - collaborative - optional is the playlist collaborative
+             """),
+    Endpoint('unfollow_playlist', DELETE, '/users/{user}/playlists/{playlist_id}/followers',
+             ('user', 'playlist_id'), ids={'playlist_id': 'playlist'},
+             doc="""
+             Unfollows (deletes) a playlist for a user
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+             """),
+    Endpoint('playlist_add_tracks', POST, '/users/{user}/playlists/{playlist_id}/tracks',
+             ('user', 'playlist_id', 'tracks', ('position', None)),
+             ids={'playlist_id': 'playlist'}, uris={'tracks': 'track'}, body=('tracks', 'position'),
+             alias={'tracks': 'uris'}, batch=('tracks', 100),
+             doc="""
+             Adds tracks to a playlist
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - tracks - a list of track URIs, URLs or IDs
+                 - position - the position to add the tracks
+             """),
+    Endpoint('playlist_replace_tracks', PUT, '/users/{user}/playlists/{playlist_id}/tracks',
+             ('user', 'playlist_id', 'tracks'),
+             ids={'playlist_id': 'playlist'}, uris={'tracks': 'track'}, body=('tracks',),
+             alias={'tracks': 'uris'}, batch=('tracks', 100),
+             doc="""
+             Replace all tracks in a playlist
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - tracks - the list of track ids to add to the playlist
+             """),
+    Endpoint('playlist_reorder_tracks', PUT, '/users/{user}/playlists/{playlist_id}/tracks',
+             ('user', 'playlist_id', 'range_start', 'insert_before', ('range_length', 1), ('snapshot_id', None)),
+             ids={'playlist_id': 'playlist'},
+             body=('range_start', 'range_length', 'insert_before', 'snapshot_id'),
+             # a reorder applied twice moves the tracks twice
+             idempotent=False,
+             doc="""
+             Reorder tracks in a playlist
+
+             Parameters:
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - range_start - the position of the first track to be reordered
+                 - range_length - optional the number of tracks to be reordered (default: 1)
+                 - insert_before - the position where the tracks should be inserted
+                 - snapshot_id - optional playlist's snapshot ID
+             """),
+    Endpoint('playlist_remove_tracks', DELETE, '/users/{user}/playlists/{playlist_id}/tracks',
+             ('user', 'playlist_id', 'tracks', ('mode', 'all'), ('snapshot_id', None)),
+             ids={'playlist_id': 'playlist'}, batch=('tracks', 100),
+             doc="""
+             Removes all occurrences of the given tracks from the given playlist
+
+             Parameters:
+                 - mode - the mode of remove, `all` or `specific`
+                 - user - the id of the user
+                 - playlist_id - the id of the playlist
+                 - tracks - if mode is `all`:
+                                 the list of track ids to remove to the playlist
+                            elif mode is `specific`:
+                                 an array of objects containing Spotify URIs of the tracks
+                                 to remove with their current positions in the playlist.  For example:
+                                 [  { "uri":"4iV5W9uYEdYUVa79Axb7Rh", "positions":[2] },
+                                    { "uri":"1301WleyT98MSxVHPZCA6M", "positions":[7] } ]
+                 - snapshot_id - optional id of the playlist snapshot
+             """),
+    Endpoint('get_playlist_follower', PUT, '/users/{playlist_owner_id}/playlists/{playlist_id}/followers',
+             ('playlist_owner_id', 'playlist_id'), ids={'playlist_id': 'playlist'},
+             doc="""
+             Add the current authenticated user as a follower of a playlist.
+
+             Parameters:
+                 - playlist_owner_id - the user id of the playlist owner
+                 - playlist_id - the id of the playlist
+             """),
+    Endpoint('playlist_is_following', GET, '/users/{playlist_owner_id}/playlists/{playlist_id}/followers/contains',
+             ('playlist_owner_id', 'playlist_id', 'user_ids'),
+             ids={'playlist_id': 'playlist'}, query=('user_ids',), alias={'user_ids': 'ids'},
+             batch=('user_ids', 5),
+             doc="""
+             Check to see if the given users are following the given playlist
+
+             Parameters:
+                 - playlist_owner_id - the user id of the playlist owner
+                 - playlist_id - the id of the playlist
+                 - user_ids - the ids of the users that you want to check to see if they follow the playlist.
+                   Maximum: 5 ids.
+             """),
+    Endpoint('featured_playlists', GET, '/browse/featured-playlists',
+             (('locale', None), ('country', None), ('timestamp', None), ('limit', 20), ('offset', 0)),
+             query=('locale', 'country', 'timestamp', 'limit', 'offset'), paging='offset', cacheable=True,
+             doc="""
+             Get a list of Spotify featured playlists
+
+             Parameters:
+                 - locale - The desired language, consisting of a lowercase ISO
+                   639 language code and an uppercase ISO 3166-1 alpha-2 country
+                   code, joined by an underscore.
+
+                 - country - An ISO 3166-1 alpha-2 country code.
+
+                 - timestamp - A timestamp in ISO 8601 format:
+                   yyyy-MM-ddTHH:mm:ss. Use this parameter to specify the user's
+                   local time to get results tailored for that specific date and
+                   time in the day
+             """ + _BROWSE_DOC),
+    Endpoint('new_releases', GET, '/browse/new-releases', (('country', None), ('limit', 20), ('offset', 0)),
+             query=('country', 'limit', 'offset'), paging='offset', cacheable=True,
+             doc="""
+             Get a list of new album releases featured in Spotify
+
+             Parameters:
+                 - country - An ISO 3166-1 alpha-2 country code.
+             """ + _BROWSE_DOC),
+    Endpoint('categories', GET, '/browse/categories',
+             (('country', None), ('locale', None), ('limit', 20), ('offset', 0)),
+             query=('country', 'locale', 'limit', 'offset'), paging='offset', cacheable=True,
+             doc="""
+             Get a list of categories used to tag items in Spotify
+
+             Parameters:
+                 - country - An ISO 3166-1 alpha-2 country code.
+                 - locale - The desired language, consisting of an ISO 639
+                   language code and an ISO 3166-1 alpha-2 country code, joined
+                   by an underscore.
+             """ + _BROWSE_DOC),
+    Endpoint('category_playlists', GET, '/browse/categories/{category_id}/playlists',
+             ('category_id', ('country', None), ('limit', 20), ('offset', 0)),
+             query=('country', 'limit', 'offset'), paging='offset', cacheable=True,
+             doc="""
+             Get a list of Spotify playlists tagged with a particular category.
+
+             Parameters:
+                 - category_id - The Spotify category ID for the category.
+
+                 - country - An ISO 3166-1 alpha-2 country code.
+             """ + _BROWSE_DOC),
+    Endpoint('recommendations', GET, '/recommendations',
+             (('seed_artists', None), ('seed_genres', None), ('seed_tracks', None), ('limit', 20),
+              ('country', None)),
+             ids={'seed_artists': 'artist', 'seed_tracks': 'track'},
+             query=('seed_artists', 'seed_genres', 'seed_tracks', 'limit', 'country'),
+             alias={'country': 'market'}, extra=TUNABLE_ATTRIBUTES,
+             doc="""
+             Get a list of recommended tracks for one to five seeds.
+
+             Parameters:
+                 - seed_artists - a list of artist IDs, URIs or URLs
+
+                 - seed_tracks - a list of artist IDs, URIs or URLs
+
+                 - seed_genres - a list of genre names. Available genres for
+                   recommendations can be found by calling recommendation_genre_seeds
+
+                 - country - An ISO 3166-1 alpha-2 country code. If provided, all
+                   results will be playable in this country.
+
+                 - limit - The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 100
+
+                 - min/max/target_<attribute> - For the tuneable track attributes listed
+                   in the documentation, these values provide filters and targeting on
+                   results.
+             """),
+    Endpoint('recommendation_genre_seeds', GET, '/recommendations/available-genre-seeds', cacheable=True,
+             doc="""
+             Get a list of genres available for the recommendations function.
+             """),
+    Endpoint('audio_analysis', GET, '/audio-analysis/{track_id}', ('track_id',),
+             ids={'track_id': 'track'}, cacheable=True,
+             doc="""
+             Get audio analysis for a track based upon its Spotify ID
+
+             Parameters:
+                 - track_id - a track URI, URL or ID
+             """),
+    Endpoint('audio_features', GET, '/audio-features', (('tracks', None),),
+             ids={'tracks': 'track'}, query=('tracks',), alias={'tracks': 'ids'},
+             batch=('tracks', 100), field='audio_features', cacheable=True,
+             doc="""
+             Get audio features for one or multiple tracks based upon their Spotify IDs
+
+             Parameters:
+                 - tracks - a list of track URIs, URLs or IDs, maximum: 100 ids
+             """),
+    Endpoint('audio_analyses', GET, '/audio-analysis/{track_ids}', ('track_ids',),
+             ids={'track_ids': 'track'}, cacheable=True,
+             doc="""
+             Get audio analysis for a track based upon its Spotify ID
+
+             Parameters:
+                 - id - a track URIs, URLs or IDs
+             """),
+)
+
+ME = _table(
+    Endpoint('user', GET, '/me',
+             doc="""
+             Get detailed profile information about the current user.
+                 An alias for the 'current_user' method.
+             """),
+    Endpoint('playlists', GET, '/me/playlists', (('limit', 50), ('offset', 0)),
+             query=('limit', 'offset'), paging='offset',
+             doc="""
+             Get current user playlists without required getting his profile
+
+             Parameters:
+                 - limit  - the number of items to return
+                 - offset - the index of the first item to return
+             """),
+    Endpoint('albums', GET, '/me/albums', (('limit', 20), ('offset', 0)),
+             query=('limit', 'offset'), paging='offset',
+             doc="""
+             Gets a list of the albums saved in the current authorized user's
+                 "Your Music" library
+
+             Parameters:
+                 - limit - the number of albums to return
+                 - offset - the index of the first album to return
+             """),
+    Endpoint('tracks', GET, '/me/tracks', (('limit', 20), ('offset', 0)),
+             query=('limit', 'offset'), paging='offset',
+             doc="""
+             Gets a list of the tracks saved in the current authorized user's
+                 "Your Music" library
+
+             Parameters:
+                 - limit - the number of tracks to return
+                 - offset - the index of the first track to return
+             """),
+    Endpoint('followed_artists', GET, '/me/following', (('limit', 20), ('after', None)),
+             query=('limit', 'after'), const={'type': 'artist'}, paging='cursor',
+             doc="""
+             Gets a list of the artists followed by the current authorized user
+
+             Parameters:
+                 - limit - the number of tracks to return
+                 - after - ghe last artist ID retrieved from the previous request
+             """),
+    Endpoint('delete_tracks', DELETE, '/me/tracks', (('tracks', None),),
+             ids={'tracks': 'track'}, query=('tracks',), alias={'tracks': 'ids'}, batch=('tracks', 50),
+             doc="""
+             Remove one or more tracks from the current user's
+                 "Your Music" library.
+
+             Parameters:
+                 - tracks - a list of track URIs, URLs or IDs
+             """),
+    Endpoint('contains_tracks', GET, '/me/tracks/contains', (('tracks', None),),
+             ids={'tracks': 'track'}, query=('tracks',), alias={'tracks': 'ids'}, batch=('tracks', 50),
+             doc="""
+             Check if one or more tracks is already saved in
+                 the current Spotify user’s “Your Music” library.
+
+             Parameters:
+                 - tracks - a list of track URIs, URLs or IDs
+             """),
+    Endpoint('add_tracks', PUT, '/me/tracks', (('tracks', None),),
+             ids={'tracks': 'track'}, query=('tracks',), alias={'tracks': 'ids'}, batch=('tracks', 50),
+             doc="""
+             Add one or more tracks to the current user's
+                 "Your Music" library.
+
+             Parameters:
+                 - tracks - a list of track URIs, URLs or IDs
+             """),
+    Endpoint('top_artists', GET, '/me/top/artists',
+             (('limit', 20), ('offset', 0), ('time_range', 'medium_term')),
+             query=('time_range', 'limit', 'offset'), paging='offset',
+             doc="""
+             Get the current user's top artists
+
+             Parameters:
+                 - limit - the number of entities to return
+                 - offset - the index of the first entity to return
+                 - time_range - Over what time frame are the affinities computed
+                   Valid-values: short_term, medium_term, long_term
+             """),
+    Endpoint('my_top_tracks', GET, '/me/top/tracks',
+             (('limit', 20), ('offset', 0), ('time_range', 'medium_term')),
+             query=('time_range', 'limit', 'offset'), paging='offset',
+             doc="""
+             Get the current user's top tracks
+
+             Parameters:
+                 - limit - the number of entities to return
+                 - offset - the index of the first entity to return
+                 - time_range - Over what time frame are the affinities computed
+                   Valid-values: short_term, medium_term, long_term
+             """),
+    Endpoint('add_albums', PUT, '/me/albums', (('albums', None),),
+             ids={'albums': 'album'}, query=('albums',), alias={'albums': 'ids'}, batch=('albums', 50),
+             doc="""
+             Add one or more albums to the current user's
+                 "Your Music" library.
+
+             Parameters:
+                 - albums - a list of album URIs, URLs or IDs
+             """),
+    Endpoint('delete_albums', DELETE, '/me/albums', (('albums', None),),
+             ids={'albums': 'album'}, query=('albums',), alias={'albums': 'ids'}, batch=('albums', 50),
+             doc="""
+             Remove one or more albums from the current user's
+                 "Your Music" library.
+
+             Parameters:
+                 - albums - a list of album URIs, URLs or IDs
+             """),
+    Endpoint('contains_albums', GET, '/me/albums/contains', (('albums', None),),
+             ids={'albums': 'album'}, query=('albums',), alias={'albums': 'ids'}, batch=('albums', 50),
+             doc="""
+             Check if one or more albums is already saved in
+                 the current Spotify user’s “Your Music” library.
+
+             Parameters:
+                 - albums - a list of album URIs, URLs or IDs
+             """),
+)
@@ -0,0 +1,262 @@
+import json
+
+from .crawler import CrawlItem
+
+# (column, Arrow type) of a flattened track row
+TRACK_COLUMNS = (
+    ('added_at', 'string'),
+    ('track_id', 'string'),
+    ('track_name', 'string'),
+    ('duration_ms', 'int64'),
+    ('explicit', 'bool'),
+    ('popularity', 'int64'),
+    ('isrc', 'string'),
+    ('disc_number', 'int64'),
+    ('track_number', 'int64'),
+    ('album_id', 'string'),
+    ('album_name', 'string'),
+    ('album_type', 'string'),
+    ('release_date', 'string'),
+    ('artist_ids', 'list<string>'),
+    ('artist_names', 'list<string>'),
+)
+
+AUDIO_FEATURE_COLUMNS = (
+    ('id', 'string'),
+    ('danceability', 'float64'),
+    ('energy', 'float64'),
+    ('key', 'int64'),
+    ('loudness', 'float64'),
+    ('mode', 'int64'),
+    ('speechiness', 'float64'),
+    ('acousticness', 'float64'),
+    ('instrumentalness', 'float64'),
+    ('liveness', 'float64'),
+    ('valence', 'float64'),
+    ('tempo', 'float64'),
+    ('duration_ms', 'int64'),
+    ('time_signature', 'int64'),
+)
+
+
+def flatten_track(item):
+    """Returns the flat row of a track, a playlist or saved track item, or
+    None for a missing track."""
+    added_at = None
+    if 'track' in item and isinstance(item['track'], (dict, type(None))):
+        added_at = item.get('added_at')
+        item = item['track']
+    if item is None:
+        return None
+    album = item.get('album') or {}
+    artists = item.get('artists') or ()
+    return {
+        'added_at': added_at,
+        'track_id': item.get('id'),
+        'track_name': item.get('name'),
+        'duration_ms': item.get('duration_ms'),
+        'explicit': item.get('explicit'),
+        'popularity': item.get('popularity'),
+        'isrc': (item.get('external_ids') or {}).get('isrc'),
+        'disc_number': item.get('disc_number'),
+        'track_number': item.get('track_number'),
+        'album_id': album.get('id'),
+        'album_name': album.get('name'),
+        'album_type': album.get('album_type'),
+        'release_date': album.get('release_date'),
+        'artist_ids': [artist.get('id') for artist in artists],
+        'artist_names': [artist.get('name') for artist in artists],
+    }
+
+
+def flatten_audio_features(item):
+    if item is None:
+        return None
+    return {column: item.get(column) for column, _ in AUDIO_FEATURE_COLUMNS}
+
+
+async def pages(http, first):
+    """Yields ``first``, an awaitable of a paging object, and every page
+    after it, one request at a time.
+
+        async for page in pages(spotify.http, spotify.me.tracks(limit=50)):
+            ...
+    """
+    page = await first
+    while page:
+        yield page
+        page = await http.next(page)
+
+
+def _crawl_tracks(item):
+    if item.kind == 'album':
+        album = {key: value for key, value in item.data.items() if key != 'tracks'}
+        tracks = (item.data.get('tracks') or {}).get('items') or ()
+    elif item.kind == 'album_tracks':
+        album = {'id': item.id}
+        tracks = item.data
+    else:
+        return ()
+    return [None if track is None else dict(track, album=album) for track in tracks]
+
+
+def _items(chunk):
+    """Returns the items of a page, a ``tracks`` or ``audio_features``
+    response, a :class:`CrawlItem`, a list of items or a single item."""
+    if isinstance(chunk, CrawlItem):
+        return _crawl_tracks(chunk)
+    if isinstance(chunk, dict):
+        for key in ('items', 'tracks', 'audio_features'):
+            if key in chunk:
+                return _items(chunk[key])
+        return (chunk,)
+    return chunk
+
+
+class _Sink:
+    def __init__(self, flatten):
+        self.flatten = flatten
+        self.rows = 0
+
+    def write(self, chunk):
+        """Writes a page, a ``tracks`` or ``audio_features`` response, the
+        tracks of a :class:`CrawlItem`, a list of items or a single item.
+        Returns the number of rows written."""
+        written = 0
+        for item in _items(chunk):
+            row = None if item is None else self.flatten(item)
+            if row is not None:
+                self._write_row(row)
+                written += 1
+        self.rows += written
+        return written
+
+    async def consume(self, source):
+        """|coro|
+        Writes everything an async iterator yields, see :meth:`write`, and
+        returns the number of rows written.
+
+        Parameters:
+            - source - an async iterator of pages, lists of items or items,
+              e.g. :func:`pages` or :meth:`DiscographyCrawler.crawl`
+        """
+        written = 0
+        async for chunk in source:
+            written += self.write(chunk)
+        return written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class NDJSONSink(_Sink):
+    """Writes one JSON object per line as rows arrive.
+
+    Parameters:
+        - file - a path or a text file object
+        - flatten - the function turning an item into a row, or None to
+          skip it
+    """
+
+    def __init__(self, file, flatten=flatten_track):
+        super().__init__(flatten)
+        self._owns_file = isinstance(file, str)
+        self.file = open(file, 'w', encoding='utf-8') if self._owns_file else file
+
+    def _write_row(self, row):
+        self.file.write(json.dumps(row, ensure_ascii=False))
+        self.file.write('\n')
+
+    def close(self):
+        if self._owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+def _arrow_type(pa, name):
+    if name.startswith('list<'):
+        return pa.list_(_arrow_type(pa, name[5:-1]))
+    return pa.type_for_alias(name)
+
+
+class _ColumnarSink(_Sink):
+    def __init__(self, columns, flatten, row_group_size):
+        super().__init__(flatten)
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError('%s needs pyarrow, install aiospotipy[arrow]' % type(self).__name__) from None
+        self.pa = pyarrow
+        self.schema = pyarrow.schema([(name, _arrow_type(pyarrow, _type)) for name, _type in columns])
+        self.row_group_size = row_group_size
+        self._columns = {name: [] for name in self.schema.names}
+        self._buffered = 0
+
+    def _write_row(self, row):
+        for name, values in self._columns.items():
+            values.append(row.get(name))
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as one row group, even if it is not full."""
+        if not self._buffered:
+            return
+        batch = self.pa.RecordBatch.from_pydict(self._columns, schema=self.schema)
+        self._write_batch(batch)
+        for values in self._columns.values():
+            values.clear()
+        self._buffered = 0
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+class ParquetSink(_ColumnarSink):
+    """Writes rows to a Parquet file in row groups of ``row_group_size``
+    rows, so only one row group is held in memory. Needs pyarrow.
+
+    Parameters:
+        - path - the file to write
+        - columns - ``(name, type)`` of the columns, e.g.
+          :data:`TRACK_COLUMNS` or :data:`AUDIO_FEATURE_COLUMNS`
+        - flatten - the function turning an item into a row, or None to
+          skip it
+        - row_group_size - the rows per row group
+        - compression - the Parquet compression codec
+    """
+
+    def __init__(self, path, columns=TRACK_COLUMNS, flatten=flatten_track, row_group_size=65536,
+                 compression='zstd'):
+        super().__init__(columns, flatten, row_group_size)
+        import pyarrow.parquet
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=compression)
+
+    def _write_batch(self, batch):
+        self._writer.write_batch(batch, row_group_size=self.row_group_size)
+
+
+class ArrowSink(_ColumnarSink):
+    """Writes rows to an Arrow IPC file in record batches of
+    ``row_group_size`` rows. Needs pyarrow.
+
+    Parameters:
+        - path - the file to write
+        - columns - ``(name, type)`` of the columns
+        - flatten - the function turning an item into a row, or None to
+          skip it
+        - row_group_size - the rows per record batch
+    """
+
+    def __init__(self, path, columns=TRACK_COLUMNS, flatten=flatten_track, row_group_size=65536):
+        super().__init__(columns, flatten, row_group_size)
+        self._writer = self.pa.ipc.new_file(path, self.schema)
+
+    def _write_batch(self, batch):
+        self._writer.write_batch(batch)
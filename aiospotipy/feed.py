@@ -0,0 +1,177 @@
+import asyncio
+import bisect
+import collections
+import logging
+import time
+
+from ._tasks import bounded_map
+from .endpoints import CATALOG
+
+log = logging.getLogger(__name__)
+
+PlaylistChange = collections.namedtuple('PlaylistChange', 'playlist_id snapshot_id added removed moved')
+PlaylistChange.__doc__ = """The changes of a playlist since it was last seen.
+
+``added`` and ``removed`` are lists of ``(uri, position)``, positions in the
+new and the old track list respectively. ``moved`` is a list of
+``(uri, old position, new position)`` of tracks kept but reordered.
+"""
+
+_TRACK_FIELDS = 'items(track(uri)),next'
+
+
+class _Watched:
+    __slots__ = ('user', 'playlist_id', 'snapshot_id', 'etag', 'uris', 'interval', 'due')
+
+    def __init__(self, user, playlist_id, snapshot_id, uris, interval):
+        self.user = user
+        self.playlist_id = playlist_id
+        self.snapshot_id = snapshot_id
+        self.etag = None
+        self.uris = uris
+        self.interval = interval
+        self.due = 0
+
+
+def diff(old, new):
+    """Returns the ``(added, removed, moved)`` lists of :class:`PlaylistChange`
+    turning the track list ``old`` into ``new``.
+
+    Tracks kept in the same relative order are not reported as moved, so
+    one moved track is one move and not a shift of every track after it.
+    """
+    positions = collections.defaultdict(collections.deque)
+    for index, uri in enumerate(old):
+        positions[uri].append(index)
+    kept = []
+    added = []
+    for index, uri in enumerate(new):
+        if positions[uri]:
+            kept.append((positions[uri].popleft(), index, uri))
+        else:
+            added.append((uri, index))
+    removed = [(uri, index) for uri, indexes in positions.items() for index in indexes]
+    removed.sort(key=lambda item: item[1])
+
+    # the longest run of kept tracks whose old positions increase stay put
+    tails = []
+    tail_index = []
+    parents = [-1] * len(kept)
+    for i, (old_index, _, _) in enumerate(kept):
+        at = bisect.bisect_left(tails, old_index)
+        if at == len(tails):
+            tails.append(old_index)
+            tail_index.append(i)
+        else:
+            tails[at] = old_index
+            tail_index[at] = i
+        parents[i] = tail_index[at - 1] if at else -1
+    stay = set()
+    i = tail_index[-1] if tail_index else -1
+    while i != -1:
+        stay.add(i)
+        i = parents[i]
+    moved = [(uri, old_index, new_index)
+             for i, (old_index, new_index, uri) in enumerate(kept) if i not in stay]
+    return added, removed, moved
+
+
+class PlaylistFeed:
+    """Watches many playlists and reports their changes.
+
+    Every playlist is polled for its ``snapshot_id`` alone, with the ETag
+    of the last poll so an unchanged playlist costs a ``304``. Only a
+    playlist whose snapshot changed has its tracks fetched again, and the
+    tracks are compared with the copy kept from the last fetch.
+
+    A playlist's polling interval halves each time it changed and grows by
+    half each time it did not, between ``min_interval`` and
+    ``max_interval``.
+
+    Parameters:
+        - http - the :class:`HTTPClient` to send requests with
+        - concurrency - the most requests in flight
+        - min_interval - the fewest seconds between two polls of a playlist
+        - max_interval - the most seconds between two polls of a playlist
+    """
+
+    def __init__(self, http, concurrency=8, min_interval=60, max_interval=3600):
+        self.http = http
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.playlists = {}
+
+    def watch(self, user, playlist_id, snapshot_id=None, uris=None):
+        """Starts watching a playlist.
+
+        Parameters:
+            - user - the id of the playlist owner
+            - playlist_id - the id of the playlist
+            - snapshot_id - the snapshot ``uris`` was taken at, if known
+            - uris - the track URIs of a stored copy of the playlist; without
+              one, the first change reports every track as added
+        """
+        self.playlists[playlist_id] = _Watched(user, playlist_id, snapshot_id, list(uris or ()), self.min_interval)
+
+    def unwatch(self, playlist_id):
+        self.playlists.pop(playlist_id, None)
+
+    def state(self):
+        """Returns the stored copies as ``{playlist_id: (user, snapshot_id,
+        uris)}``, to be given back to :meth:`watch` after a restart."""
+        return {w.playlist_id: (w.user, w.snapshot_id, list(w.uris)) for w in self.playlists.values()}
+
+    async def _tracks(self, watched):
+        page = await self.http.get_playlist_tracks(watched.user, watched.playlist_id,
+                                                   fields=_TRACK_FIELDS, limit=100)
+        uris = []
+        while page:
+            uris.extend(item['track']['uri'] for item in page['items'] if item.get('track'))
+            page = await self.http.next(page)
+        return uris
+
+    async def _poll(self, watched):
+        route = CATALOG['user_playlist'].route(watched.user, watched.playlist_id, 'snapshot_id')
+        etag, result = await self.http.request_if_changed(route, watched.etag)
+        if result is None or result['snapshot_id'] == watched.snapshot_id:
+            watched.etag = etag
+            watched.interval = min(self.max_interval, watched.interval * 1.5)
+            return None
+        # nothing is kept until the tracks are fetched, so a failed fetch
+        # sees the new snapshot again at the next poll
+        uris = await self._tracks(watched)
+        added, removed, moved = diff(watched.uris, uris)
+        watched.etag = etag
+        watched.interval = max(self.min_interval, watched.interval / 2)
+        watched.snapshot_id = result['snapshot_id']
+        watched.uris = uris
+        return PlaylistChange(watched.playlist_id, watched.snapshot_id, added, removed, moved)
+
+    async def poll(self):
+        """Polls every playlist that is due and yields a
+        :class:`PlaylistChange` for each one that changed.
+
+        A playlist that failed to poll is retried at its next interval.
+        """
+        now = time.monotonic()
+        due = [w for w in self.playlists.values() if w.due <= now]
+        async for index, change, error in bounded_map(self._poll, due, self.concurrency):
+            watched = due[index]
+            watched.due = time.monotonic() + watched.interval
+            if error is not None:
+                log.warning('polling playlist %s failed: %r', watched.playlist_id, error)
+            elif change is not None:
+                yield change
+
+    async def changes(self):
+        """Polls the playlists forever, each one when it is due, and yields
+        their changes as they are found."""
+        while True:
+            async for change in self.poll():
+                yield change
+            if self.playlists:
+                wait = min(w.due for w in self.playlists.values()) - time.monotonic()
+            else:
+                wait = self.min_interval
+            await asyncio.sleep(max(wait, 0))
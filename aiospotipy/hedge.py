@@ -0,0 +1,117 @@
+import asyncio
+import collections
+import time
+
+
+class HedgePolicy:
+    """Sends a duplicate of a slow idempotent request and keeps whichever
+    answer arrives first.
+
+    Parameters:
+        - percentile - the percentile of recent latencies after which a
+          duplicate is sent
+        - budget - the fraction of extra requests hedging may add
+        - window - how many recent latencies are kept
+        - min_samples - no hedge is sent until this many latencies are known
+        - min_delay - the hedge delay never goes below this many seconds
+        - max_delay - the hedge delay never goes above this many seconds
+        - burst - the most hedges in a row when the budget is unused
+    """
+
+    def __init__(self, percentile=95, budget=0.05, window=512, min_samples=20,
+                 min_delay=0.01, max_delay=None, burst=10):
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.burst = burst
+        self._latencies = collections.deque(maxlen=window)
+        self._delay = None
+        self._dirty = 0
+        self._tokens = float(burst)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, latency):
+        self._latencies.append(latency)
+        self._dirty += 1
+
+    def delay(self):
+        """Returns the current hedge delay in seconds, or None while there
+        are not enough samples."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        # re-sorting the window on every request is wasteful, the
+        # percentile barely moves between a handful of samples
+        if self._delay is None or self._dirty >= 16:
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+            delay = max(ordered[index], self.min_delay)
+            if self.max_delay is not None:
+                delay = min(delay, self.max_delay)
+            self._delay = delay
+            self._dirty = 0
+        return self._delay
+
+    def _acquire(self):
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'delay': self.delay(),
+            'tokens': self._tokens,
+        }
+
+    async def _timed(self, coro_factory):
+        start = time.monotonic()
+        result = await coro_factory()
+        self.record(time.monotonic() - start)
+        return result
+
+    async def run(self, coro_factory):
+        """|coro|
+        Runs ``coro_factory()`` and, if it has not answered within the hedge
+        delay and the budget allows it, runs it a second time. The first
+        successful result wins and the other attempt is cancelled.
+        """
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        delay = self.delay()
+        primary = asyncio.ensure_future(self._timed(coro_factory))
+        if delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            if not self._acquire():
+                return await primary
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(self._timed(coro_factory))
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
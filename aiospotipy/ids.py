@@ -0,0 +1,191 @@
+import functools
+import logging
+
+log = logging.getLogger(__name__)
+
+BASE62 = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+# maps ASCII to base62 digit values, anything else to 255
+_DIGITS = bytes(BASE62.index(chr(c)) if chr(c) in BASE62 else 255 for c in range(256))
+# two base62 digits at a time halves the work of unpack_id
+_PAIRS = [a + b for a in BASE62 for b in BASE62]
+
+
+def _is_id(value):
+    return len(value) == 22 and value.isalnum() and value.isascii()
+
+
+@functools.lru_cache(maxsize=1 << 17)
+def parse_id(value):
+    """Returns ``(type, id)`` for an ID, ``spotify:`` URI or open.spotify.com
+    URL. The type is None for a bare ID. Raises ValueError if ``value`` is not
+    a Spotify ID."""
+    if value.startswith('spotify:'):
+        rest, _, _id = value.rpartition(':')
+        itype = rest.rpartition(':')[2]
+    elif 'open.spotify.com/' in value:
+        rest, _, _id = value.partition('?')[0].partition('#')[0].rstrip('/').rpartition('/')
+        itype = rest.rpartition('/')[2]
+    else:
+        itype, _id = None, value
+    if not _is_id(_id):
+        raise ValueError('invalid Spotify ID, URI or URL: %r' % (value,))
+    return itype, _id
+
+
+def get_id(_type, _id):
+    if len(_id) == 22 and _id.isalnum() and _id.isascii():
+        return _id
+    itype, _id = parse_id(_id)
+    if itype is not None and _type != itype:
+        log.debug('expected id of type %s but found type %s %s', _type, itype, _id)
+    return _id
+
+
+def get_ids(_type, ids):
+    """Normalizes a list of IDs, URIs or URLs to a list of IDs."""
+    return [i if len(i) == 22 and i.isalnum() and i.isascii() else get_id(_type, i) for i in ids]
+
+
+def get_uri(_type, _id):
+    return 'spotify:' + _type + ":" + get_id(_type, _id)
+
+
+def pack_id(_id):
+    """Packs a 22 character base62 ID into 16 bytes."""
+    digits = _id.encode('ascii', 'replace').translate(_DIGITS)
+    if len(digits) != 22 or max(digits) == 255:
+        raise ValueError('invalid Spotify ID: %r' % (_id,))
+    n = 0
+    for high, low in zip(digits[::2], digits[1::2]):
+        n = n * 3844 + high * 62 + low
+    if n >> 128:
+        raise ValueError('invalid Spotify ID: %r' % (_id,))
+    return n.to_bytes(16, 'big')
+
+
+def unpack_id(packed):
+    """Returns the base62 ID packed by :func:`pack_id`."""
+    n = int.from_bytes(packed, 'big')
+    pairs = []
+    for _ in range(11):
+        n, pair = divmod(n, 3844)
+        pairs.append(_PAIRS[pair])
+    pairs.reverse()
+    return ''.join(pairs)
+
+
+def pack_ids(_type, ids):
+    """Normalizes and packs IDs, URIs or URLs into one bytes object of 16
+    bytes per ID."""
+    return b''.join([pack_id(get_id(_type, i)) for i in ids])
+
+
+def unpack_ids(packed):
+    """Returns the list of IDs packed by :func:`pack_ids`."""
+    return [unpack_id(packed[i:i + 16]) for i in range(0, len(packed), 16)]
+
+
+class IDSet:
+    """A set of Spotify IDs stored as packed 16 byte values in one open
+    addressing table, a fraction of the memory of a ``set`` of ``str``.
+
+    Parameters:
+        - ids - IDs, URIs or URLs to start with
+        - _type - the type the IDs are normalized for
+    """
+
+    __slots__ = ('_type', '_table', '_mask', '_size', '_zero')
+
+    _EMPTY = bytes(16)
+
+    def __init__(self, ids=(), _type=None, capacity=1024):
+        self._type = _type
+        size = 16
+        while size < capacity:
+            size <<= 1
+        self._table = bytearray(16 * size)
+        self._mask = size - 1
+        self._size = 0
+        # the all zero ID doubles as the empty slot marker
+        self._zero = False
+        for i in ids:
+            self.add(i)
+
+    def __len__(self):
+        return self._size
+
+    def _find(self, key):
+        table = self._table
+        index = int.from_bytes(key[:8], 'little') & self._mask
+        while True:
+            start = index << 4
+            slot = table[start:start + 16]
+            if slot == key or slot == self._EMPTY:
+                return start, slot == key
+            index = (index + 1) & self._mask
+
+    def _key(self, _id):
+        return pack_id(get_id(self._type, _id))
+
+    def __contains__(self, _id):
+        key = self._key(_id)
+        if key == self._EMPTY:
+            return self._zero
+        return self._find(key)[1]
+
+    def add(self, _id):
+        """Adds an ID and returns True if it was not in the set yet."""
+        key = self._key(_id)
+        if key == self._EMPTY:
+            added, self._zero = not self._zero, True
+            self._size += added
+            return added
+        start, found = self._find(key)
+        if found:
+            return False
+        self._table[start:start + 16] = key
+        self._size += 1
+        if self._size * 2 > self._mask:
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self._table
+        self._table = bytearray(len(old) * 2)
+        self._mask = (self._mask << 1) | 1
+        for start in range(0, len(old), 16):
+            key = bytes(old[start:start + 16])
+            if key != self._EMPTY:
+                new_start = self._find(key)[0]
+                self._table[new_start:new_start + 16] = key
+
+    def __iter__(self):
+        if self._zero:
+            yield unpack_id(self._EMPTY)
+        table = self._table
+        for start in range(0, len(table), 16):
+            key = table[start:start + 16]
+            if key != self._EMPTY:
+                yield unpack_id(key)
+
+    def to_bytes(self):
+        """Returns the members packed as by :func:`pack_ids`."""
+        keys = [self._EMPTY] if self._zero else []
+        table = self._table
+        keys.extend(bytes(table[s:s + 16]) for s in range(0, len(table), 16) if table[s:s + 16] != self._EMPTY)
+        return b''.join(keys)
+
+    @classmethod
+    def from_bytes(cls, packed, _type=None):
+        self = cls(_type=_type, capacity=len(packed) // 8)
+        for start in range(0, len(packed), 16):
+            key = packed[start:start + 16]
+            if key == cls._EMPTY:
+                self._size += not self._zero
+                self._zero = True
+                continue
+            table_start, found = self._find(key)
+            if not found:
+                self._table[table_start:table_start + 16] = key
+                self._size += 1
+        return self
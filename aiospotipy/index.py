@@ -0,0 +1,132 @@
+import array
+
+from .ids import get_id, pack_id, unpack_id
+
+_NO_ALBUM = 0xFFFFFFFF
+
+
+def _tracks(page):
+    """Returns the track objects of a page of ``get_playlist_tracks``,
+    ``Me.tracks`` or ``tracks``, or of a plain list of tracks."""
+    if isinstance(page, dict):
+        page = page['items'] if 'items' in page else page['tracks']
+    for item in page:
+        if item is not None and 'track' in item and isinstance(item['track'], (dict, type(None))):
+            item = item['track']
+        if item is not None and item.get('id'):
+            yield item
+
+
+class TrackIndex:
+    """Keeps the fields of many tracks in compact columns, with lookups by
+    ID, ISRC and artist.
+
+    Each track takes about 400 bytes, mostly the keys of the lookup dicts,
+    instead of the several kilobytes of its decoded JSON object. A track
+    already in the index is not added again.
+
+    Parameters:
+        - pages - pages or lists of tracks to start with, see :meth:`add`
+    """
+
+    def __init__(self, pages=()):
+        self._ids = bytearray()
+        self.duration_ms = array.array('I')
+        self.popularity = array.array('B')
+        self.explicit = bytearray()
+        self._albums = array.array('I')
+        self._isrcs = bytearray()
+        self._album_ids = []
+        self._album_rows = {}
+        self._by_id = {}
+        self._by_isrc = {}
+        self._by_artist = {}
+        for page in pages:
+            self.add(page)
+
+    def __len__(self):
+        return len(self.duration_ms)
+
+    def __contains__(self, track_id):
+        return pack_id(get_id('track', track_id)) in self._by_id
+
+    def add(self, page):
+        """Adds the tracks of a page as soon as it arrives.
+
+        ``page`` is a page of ``get_playlist_tracks`` or ``Me.tracks``, a
+        ``tracks`` response or a list of track objects. Returns the number
+        of tracks added.
+        """
+        added = 0
+        for track in _tracks(page):
+            key = pack_id(track['id'])
+            if key in self._by_id:
+                continue
+            row = len(self.duration_ms)
+            self._by_id[key] = row
+            self._ids += key
+            self.duration_ms.append(track.get('duration_ms') or 0)
+            self.popularity.append(track.get('popularity') or 0)
+            self.explicit.append(bool(track.get('explicit')))
+
+            album = track.get('album') or {}
+            album_id = album.get('id')
+            if album_id:
+                album_key = pack_id(album_id)
+                album_row = self._album_rows.get(album_key)
+                if album_row is None:
+                    album_row = self._album_rows[album_key] = len(self._album_ids)
+                    self._album_ids.append(album_key)
+                self._albums.append(album_row)
+            else:
+                self._albums.append(_NO_ALBUM)
+
+            isrc = (track.get('external_ids') or {}).get('isrc') or ''
+            self._isrcs += isrc.upper().encode('ascii', 'replace')[:12].ljust(12)
+            if isrc:
+                self._by_isrc.setdefault(isrc.upper(), array.array('I')).append(row)
+
+            for artist in track.get('artists') or ():
+                if artist.get('id'):
+                    self._by_artist.setdefault(pack_id(artist['id']), array.array('I')).append(row)
+            added += 1
+        return added
+
+    def id(self, row):
+        return unpack_id(self._ids[row * 16:row * 16 + 16])
+
+    def album_id(self, row):
+        album = self._albums[row]
+        return None if album == _NO_ALBUM else unpack_id(self._album_ids[album])
+
+    def isrc(self, row):
+        return self._isrcs[row * 12:row * 12 + 12].decode('ascii').rstrip() or None
+
+    def row(self, row):
+        """Returns the indexed fields of a row as a dict."""
+        return {
+            'id': self.id(row),
+            'duration_ms': self.duration_ms[row],
+            'popularity': self.popularity[row],
+            'explicit': bool(self.explicit[row]),
+            'album_id': self.album_id(row),
+            'isrc': self.isrc(row),
+        }
+
+    def find(self, track_id):
+        """Returns the row of a track ID, URI or URL, or None."""
+        return self._by_id.get(pack_id(get_id('track', track_id)))
+
+    def by_isrc(self, isrc):
+        """Returns the rows of the tracks with an ISRC."""
+        return list(self._by_isrc.get(isrc.upper(), ()))
+
+    def by_artist(self, artist_id):
+        """Returns the rows of the tracks of an artist ID, URI or URL."""
+        return list(self._by_artist.get(pack_id(get_id('artist', artist_id)), ()))
+
+    def has_isrc(self, isrc):
+        return isrc.upper() in self._by_isrc
+
+    def has_artist(self, artist_id):
+        return pack_id(get_id('artist', artist_id)) in self._by_artist
@@ -0,0 +1,150 @@
+from ._tasks import bounded_map
+from .endpoints import ME
+from .ids import get_ids
+
+
+class Bitmap:
+    """One bit per checked ID, in the order the IDs were given."""
+
+    __slots__ = ('_bits', '_size')
+
+    def __init__(self, size):
+        self._bits = bytearray((size + 7) // 8)
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not -self._size <= index < self._size:
+            raise IndexError('bitmap index out of range')
+        index %= self._size
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def set(self, index):
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def count(self):
+        """Returns the number of set bits."""
+        return sum(bin(byte).count('1') for byte in self._bits)
+
+    def to_bytes(self):
+        return bytes(self._bits)
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class Library:
+    """Bulk operations on the current user's saved tracks and albums.
+
+    Parameters:
+        - me - the :class:`Me` of the user, e.g. ``spotify.me``
+        - concurrency - the most requests in flight
+    """
+
+    def __init__(self, me, concurrency=4):
+        self.me = me
+        self.concurrency = concurrency
+
+    async def _all(self, fetch, _type):
+        first = await fetch(limit=50, offset=0)
+        pages = [first]
+        offsets = range(len(first['items']), first['total'], 50)
+        async for _, page, error in bounded_map(lambda offset: fetch(limit=50, offset=offset),
+                                                offsets, self.concurrency):
+            if error is not None:
+                raise error
+            pages.append(page)
+        ids = []
+        for page in pages:
+            ids.extend(item[_type]['id'] for item in page['items'])
+        return ids
+
+    async def track_ids(self):
+        """|coro|
+        returns the IDs of every saved track, fetching the pages concurrently
+        """
+        return await self._all(self.me.tracks, 'track')
+
+    async def album_ids(self):
+        """|coro|
+        returns the IDs of every saved album, fetching the pages concurrently
+        """
+        return await self._all(self.me.albums, 'album')
+
+    async def _apply(self, changes):
+        """Sends ``(endpoint name, ids)`` changes in chunks of the endpoint's batch size."""
+        jobs = [(getattr(self.me, name), chunk)
+                for name, ids in changes
+                for chunk in _chunks(ids, ME[name].batch[1])]
+        async for _, _, error in bounded_map(lambda job: job[0](job[1]), jobs, self.concurrency):
+            if error is not None:
+                raise error
+
+    async def _contains(self, name, _type, ids):
+        ids = get_ids(_type, ids)
+        size = ME[name].batch[1]
+        chunks = _chunks(ids, size)
+        bitmap = Bitmap(len(ids))
+        async for index, result, error in bounded_map(getattr(self.me, name), chunks, self.concurrency):
+            if error is not None:
+                raise error
+            start = index * size
+            for offset, saved in enumerate(result):
+                if saved:
+                    bitmap.set(start + offset)
+        return bitmap
+
+    async def contains_tracks(self, tracks):
+        """|coro|
+        Check which of any number of tracks are saved, 50 per request.
+        Returns a :class:`Bitmap` in the order of ``tracks``.
+
+        Parameters:
+            - tracks - a list of track URIs, URLs or IDs
+        """
+        return await self._contains('contains_tracks', 'track', tracks)
+
+    async def contains_albums(self, albums):
+        """|coro|
+        Check which of any number of albums are saved, 50 per request.
+        Returns a :class:`Bitmap` in the order of ``albums``.
+
+        Parameters:
+            - albums - a list of album URIs, URLs or IDs
+        """
+        return await self._contains('contains_albums', 'album', albums)
+
+    async def _sync(self, current, desired, _type, add, delete):
+        current = set(current)
+        desired = set(get_ids(_type, desired))
+        to_add = sorted(desired - current)
+        to_delete = sorted(current - desired)
+        await self._apply([(add, to_add), (delete, to_delete)])
+        return {'added': to_add, 'deleted': to_delete}
+
+    async def sync_tracks(self, desired):
+        """|coro|
+        Makes the saved tracks exactly ``desired``, adding and deleting
+        tracks 50 per request. Returns the added and deleted IDs.
+
+        Parameters:
+            - desired - a list of track URIs, URLs or IDs
+        """
+        return await self._sync(await self.track_ids(), desired, 'track', 'add_tracks', 'delete_tracks')
+
+    async def sync_albums(self, desired):
+        """|coro|
+        Makes the saved albums exactly ``desired``, adding and deleting
+        albums 50 per request. Returns the added and deleted IDs.
+
+        Parameters:
+            - desired - a list of album URIs, URLs or IDs
+        """
+        return await self._sync(await self.album_ids(), desired, 'album', 'add_albums', 'delete_albums')
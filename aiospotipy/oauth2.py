@@ -25,13 +25,16 @@ class SpotifyCredentials(object):
     async def get_access_token(self):
         if self.token_info and not is_token_expired(self.token_info):
             return self.token_info['access_token']
+        token_info = await self.request_access_token()
+        self.token_info = self._add_custom_values_to_token_info(token_info)
+        return self.token_info['access_token']
 
     async def request_access_token(self):
         payload = {'grant_type': 'client_credentials'}
         auth_header = base64.b64encode(str(self.client_id + ':' + self.client_secret).encode())
         headers = {'Authorization': 'Basic %s' % auth_header.decode()}
         async with aiohttp.ClientSession() as session:
-            async with session.post(self.OAUTH_TOKEN_URL, data=payload, headers=headers, verify=True,
+            async with session.post(self.OAUTH_TOKEN_URL, data=payload, headers=headers,
                                     proxy=self.proxy) as response:
                 if response.status != 200:
                     raise SpotifyOauthError(response.reason)
@@ -58,7 +61,7 @@ if __name__ == '__main__':
         return "5"
 
     async def t():
-        return await asyncio.wait_for(test(), 30, loop=loop)
+        return await asyncio.wait_for(test(), 30)
 
     def tt():
         return t()
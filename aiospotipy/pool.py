@@ -0,0 +1,54 @@
+from ._http import HTTPClient
+from .cache import TTLCache
+from .client import Spotify
+from .me import Me
+
+
+class UserMe(Me):
+    """A :class:`Me` view sending every request with one user's token.
+
+    Views hold only the shared client and the token, so one can be made
+    per request or kept for each of many users.
+    """
+
+    __slots__ = ('token',)
+
+    def __init__(self, _http, token):
+        self.http = _http
+        self.token = token
+
+    def request(self, route, **kwargs):
+        return self.http.request(route, auth=self.token, **kwargs)
+
+
+class ClientPool:
+    """Serves many users from one :class:`HTTPClient`, so all of them share
+    its connection pool, rate limiter and catalog cache.
+
+    Parameters:
+        - client_credentials_manager - the credentials catalog requests are
+          sent with when no user token is given
+        - cache - the :class:`TTLCache` for catalog responses, None for a
+          default one, False for no cache
+        - other keyword arguments are passed to :class:`HTTPClient`
+    """
+
+    def __init__(self, client_credentials_manager=None, *, cache=None, **kwargs):
+        if cache is None:
+            cache = TTLCache(maxsize=16384, ttl=300)
+        self.http = HTTPClient(None, client_credentials_manager, cache=None if cache is False else cache, **kwargs)
+        self.catalog = Spotify(http=self.http)
+
+    def user(self, token):
+        """Returns the :class:`UserMe` view of the user owning ``token``, a
+        token string or an object with a ``get_access_token`` coroutine."""
+        return UserMe(self.http, token)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        await self.http.close()
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Schedules requests under a rate and a concurrency budget.
+
+    Requests are let through at ``rate`` per ``per`` seconds, with bursts of
+    up to ``burst`` requests, and at most ``max_concurrency`` at a time. A
+    429 answer pauses every request for its ``Retry-After``. One limiter can
+    be shared by several clients.
+
+    Parameters:
+        - rate - the number of requests per ``per`` seconds, None for no limit
+        - per - the period of ``rate`` in seconds
+        - burst - how many requests may go out back to back
+        - max_concurrency - the number of requests in flight, None for no limit
+    """
+
+    def __init__(self, rate=None, per=1.0, burst=1, max_concurrency=None):
+        self.rate = rate
+        self.per = per
+        self.max_concurrency = max_concurrency
+        self._interval = per / rate if rate else 0.0
+        self._tau = (burst - 1) * self._interval
+        self._tat = 0.0
+        self._paused_until = 0.0
+        # created on first use, a semaphore built outside a running loop is
+        # bound to the wrong one before Python 3.10
+        self._semaphore = None
+        self.in_flight = 0
+        self.requests = 0
+        self.waited = 0.0
+
+    def pause(self, seconds):
+        """Holds back every request for ``seconds``."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def _wait_turn(self):
+        now = time.monotonic()
+        while self._paused_until > now:
+            self.waited += self._paused_until - now
+            await asyncio.sleep(self._paused_until - now)
+            now = time.monotonic()
+        if self._interval:
+            # GCRA: reserve the next free slot, then sleep until it comes
+            tat = max(self._tat, now)
+            self._tat = tat + self._interval
+            wait = tat - self._tau - now
+            if wait > 0:
+                self.waited += wait
+                await asyncio.sleep(wait)
+
+    async def acquire(self):
+        if self._semaphore is None and self.max_concurrency:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            await self._wait_turn()
+        except BaseException:
+            if self._semaphore is not None:
+                self._semaphore.release()
+            raise
+        self.in_flight += 1
+        self.requests += 1
+
+    def release(self):
+        self.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    def stats(self):
+        return {
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'waited': self.waited,
+            'paused_for': max(0.0, self._paused_until - time.monotonic()),
+        }
@@ -0,0 +1,127 @@
+import time
+
+from ._tasks import bounded_map
+from .bulk import BulkResult
+from .endpoints import TUNABLE_ATTRIBUTES
+
+_SEEDS = ('seed_artists', 'seed_genres', 'seed_tracks')
+
+
+def _seeds(value):
+    """Returns the seeds of one seed parameter: None, one seed or a list."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+class RecommendationEngine:
+    """Runs recommendation requests for many seed sets at once.
+
+    Parameters:
+        - http - the :class:`HTTPClient` to send requests with
+        - concurrency - the most requests in flight, on top of the
+          client's rate limiter
+        - entity_cache - a :class:`TTLCache` the returned track objects are
+          shared through, so a track recommended to many seed sets is kept
+          in memory once
+        - genre_ttl - how long the available genre seeds are cached
+    """
+
+    def __init__(self, http, concurrency=8, entity_cache=None, genre_ttl=86400):
+        self.http = http
+        self.concurrency = concurrency
+        self.entity_cache = entity_cache
+        self.genre_ttl = genre_ttl
+        self._genres = None
+        self._genres_expire = 0
+
+    async def genre_seeds(self):
+        """|coro|
+        returns the set of available genre seeds, fetched once per ``genre_ttl``
+        """
+        now = time.monotonic()
+        if self._genres is None or self._genres_expire <= now:
+            result = await self.http.recommendation_genre_seeds()
+            self._genres = frozenset(result['genres'])
+            self._genres_expire = now + self.genre_ttl
+        return self._genres
+
+    def validate(self, seed_set, genres):
+        """Raises ValueError if ``seed_set`` cannot be sent."""
+        count = 0
+        for key, value in seed_set.items():
+            if key in _SEEDS:
+                count += len(_seeds(value))
+            elif key not in TUNABLE_ATTRIBUTES and key not in ('limit', 'country'):
+                raise ValueError('unknown recommendation parameter %r' % key)
+        if not 1 <= count <= 5:
+            raise ValueError('a seed set needs 1 to 5 seeds, got %d' % count)
+        unknown = set(_seeds(seed_set.get('seed_genres'))) - genres
+        if unknown:
+            raise ValueError('unknown genre seeds: %s' % ', '.join(sorted(unknown)))
+
+    async def stream(self, seed_sets, *, dedupe=False, limit=20, country=None, **targets):
+        """Yields a :class:`BulkResult` of ``(index, tracks, error)`` for
+        every seed set as its request finishes. A failed request does not
+        stop the others, its ``error`` is the exception it raised.
+
+        Parameters:
+            - seed_sets - dicts of ``seed_artists``, ``seed_genres`` and
+              ``seed_tracks``, optionally with their own ``limit``, ``country``
+              and tunable attributes
+            - dedupe - drop tracks already yielded for an earlier seed set
+            - limit - the number of tracks per seed set
+            - country - An ISO 3166-1 alpha-2 country code.
+            - min/max/target_<attribute> - targets applied to every seed set
+
+        Every seed set is validated before the first request is sent.
+        """
+        unknown = set(targets) - TUNABLE_ATTRIBUTES
+        if unknown:
+            raise ValueError('unknown tunable attributes: %s' % ', '.join(sorted(unknown)))
+        seed_sets = list(seed_sets)
+        genres = await self.genre_seeds() if any(s.get('seed_genres') for s in seed_sets) else frozenset()
+        for index, seed_set in enumerate(seed_sets):
+            try:
+                self.validate(seed_set, genres)
+            except ValueError as e:
+                raise ValueError('seed set %d: %s' % (index, e)) from None
+
+        async def fetch(seed_set):
+            params = dict(targets, limit=limit, country=country)
+            params.update(seed_set)
+            return await self.http.recommendations(**params)
+
+        seen = set()
+        cache = self.entity_cache
+        async for index, result, error in bounded_map(fetch, seed_sets, self.concurrency):
+            if error is not None:
+                yield BulkResult(index, None, error)
+                continue
+            tracks = result['tracks']
+            if cache is not None:
+                tracks = [cache.setdefault(track['id'], track) for track in tracks]
+            if dedupe:
+                tracks = [track for track in tracks if track['id'] not in seen]
+                seen.update(track['id'] for track in tracks)
+            yield BulkResult(index, tracks, None)
+
+    async def gather(self, seed_sets, *, return_exceptions=False, **kwargs):
+        """|coro|
+        returns the tracks of every seed set, in the order of ``seed_sets``
+
+        Parameters:
+            - return_exceptions - put the exception of a failed seed set in
+              its place instead of raising it
+        """
+        seed_sets = list(seed_sets)
+        results = [None] * len(seed_sets)
+        async for index, tracks, error in self.stream(seed_sets, **kwargs):
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                tracks = error
+            results[index] = tracks
+        return results
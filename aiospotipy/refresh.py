@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+
+from ._tasks import bounded_map
+from .endpoints import CATALOG, Route
+
+log = logging.getLogger(__name__)
+
+
+class RefreshAhead:
+    """Refreshes often used cached responses in the background before they
+    expire, so callers keep being served from the cache.
+
+    Every cache hit of the :class:`HTTPClient` is counted. Every
+    ``interval`` seconds, entries expiring within ``ahead`` seconds that
+    were hit at least ``min_hits`` times since they were cached are fetched
+    again, and the old copy is served until the new one replaces it.
+    Entries that expire anyway are forgotten.
+
+        async with RefreshAhead(spotify.http) as refresher:
+            await refresher.warm([('new_releases', 'JP'), ('artist', artist_id)])
+            ...
+
+    Parameters:
+        - http - the :class:`HTTPClient` to refresh the cache of, it must
+          have a cache
+        - ahead - how many seconds before expiry an entry is refreshed
+        - min_hits - the fewest hits an entry needs to be refreshed
+        - interval - the seconds between two looks at the cache
+        - concurrency - the most refreshes in flight
+        - maxsize - the most entries tracked
+    """
+
+    def __init__(self, http, ahead=30, min_hits=2, interval=1.0, concurrency=4, maxsize=4096):
+        if http.cache is None:
+            raise ValueError('refresh-ahead needs an HTTPClient with a cache')
+        self.http = http
+        self.ahead = ahead
+        self.min_hits = min_hits
+        self.interval = interval
+        self.concurrency = concurrency
+        self.maxsize = maxsize
+        self.refreshes = 0
+        self.failures = 0
+        self._hot = {}
+        self._task = None
+
+    def touch(self, key, route):
+        """Counts a cache hit of ``key``, the cache key of ``route``."""
+        entry = self._hot.get(key)
+        if entry is not None:
+            entry[1] += 1
+        elif len(self._hot) < self.maxsize:
+            self._hot[key] = [route, 1]
+
+    def start(self):
+        """Starts counting hits and refreshing in the background."""
+        self.http.refresher = self
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def stop(self):
+        if self.http.refresher is self:
+            self.http.refresher = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh_due()
+
+    def _due(self):
+        now = time.monotonic()
+        due = []
+        for key, (_, hits) in list(self._hot.items()):
+            expires = self.http.cache.expires(key)
+            if expires is None or expires <= now:
+                del self._hot[key]
+            elif expires - now <= self.ahead and hits >= self.min_hits:
+                due.append(key)
+        return due
+
+    async def refresh_due(self):
+        """|coro|
+        refreshes the entries that are due now, see :class:`RefreshAhead`
+        """
+        keys = self._due()
+        routes = [self._hot[key][0] for key in keys]
+        async for index, _, error in bounded_map(self.http.refresh, routes, self.concurrency):
+            entry = self._hot.get(keys[index])
+            if entry is not None:
+                entry[1] = 0
+            if error is not None:
+                self.failures += 1
+                log.warning('refreshing %s failed: %r', routes[index].url, error)
+            else:
+                self.refreshes += 1
+
+    async def warm(self, items):
+        """|coro|
+        Fetches and caches responses ahead of their first use. Requests go
+        through the rate limiter of the client, ``concurrency`` at a time.
+        Returns a list of ``(item, exception)`` of the items that failed.
+
+        Parameters:
+            - items - :class:`Route` objects or tuples of an endpoint name
+              and its arguments, e.g. ``('artist', artist_id)`` or
+              ``('featured_playlists', 'ja_JP', 'JP')``
+        """
+        items = list(items)
+        routes = [item if isinstance(item, Route) else CATALOG[item[0]].route(*item[1:]) for item in items]
+        failed = []
+        async for index, _, error in bounded_map(self.http.refresh, routes, self.concurrency):
+            if error is not None:
+                failed.append((items[index], error))
+        return failed
+
+    def stats(self):
+        return {'tracked': len(self._hot), 'refreshes': self.refreshes, 'failures': self.failures}
@@ -0,0 +1,159 @@
+import asyncio
+import collections
+import random
+import time
+
+import aiohttp
+
+from ._http import _deadline, POST
+
+# 429 means the request was refused before being processed, so even a
+# request that is not idempotent may be sent again
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Sends a request again after a connection error, a timeout or a
+    status in ``statuses``, waiting a random time up to an exponentially
+    growing backoff between attempts (full jitter).
+
+    Only idempotent endpoints are retried, see
+    :attr:`Endpoint.idempotent`. Endpoints in ``snapshot_checked`` are
+    retried only if the playlist's ``snapshot_id`` shows the failed attempt
+    did not change it. A ``429`` is retried for every endpoint.
+
+    Retries stop after ``max_attempts`` attempts, after ``max_elapsed``
+    seconds, before the :func:`deadline` would pass, or when the retry
+    budget is used up.
+
+    Parameters:
+        - max_attempts - the most attempts per request, the first included
+        - base_delay - the backoff before the second attempt, in seconds
+        - max_delay - the backoff never goes above this many seconds
+        - max_elapsed - no attempt starts this many seconds after the first
+        - budget - the fraction of extra requests retries may add
+        - burst - the most retries in a row when the budget is unused
+        - statuses - the response statuses that are retried
+        - snapshot_checked - the names of the endpoints retried after a
+          snapshot check
+    """
+
+    def __init__(self, max_attempts=4, base_delay=0.1, max_delay=10.0, max_elapsed=30.0, budget=0.1,
+                 burst=10, statuses=RETRY_STATUSES, snapshot_checked=frozenset({'playlist_add_tracks'})):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.budget = budget
+        self.burst = burst
+        self.statuses = frozenset(statuses)
+        self.snapshot_checked = frozenset(snapshot_checked)
+        self._tokens = float(burst)
+        self.requests = 0
+        self.retries = 0
+        self.attempts = collections.Counter()
+        self.failures = collections.Counter()
+        self.gave_up = collections.Counter()
+
+    def mode(self, route):
+        """Returns ``'always'``, ``'snapshot'`` or None, how ``route`` may
+        be retried."""
+        endpoint = route.endpoint
+        if endpoint is None:
+            return None if route.method == POST else 'always'
+        if endpoint.idempotent:
+            return 'always'
+        if endpoint.name in self.snapshot_checked:
+            return 'snapshot'
+        return None
+
+    def backoff(self, attempt):
+        """Returns the seconds to wait after the ``attempt``-th attempt failed."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'attempts': dict(self.attempts),
+            'failures': dict(self.failures),
+            'gave_up': dict(self.gave_up),
+            'tokens': self._tokens,
+        }
+
+    def _give_up_reason(self, mode, attempt, status, start, delay):
+        if mode is None and status != 429:
+            return 'not_idempotent'
+        if attempt >= self.max_attempts:
+            return 'attempts'
+        now = time.monotonic()
+        if now + delay - start > self.max_elapsed:
+            return 'elapsed'
+        until = _deadline.get()
+        if until is not None and now + delay >= until:
+            return 'deadline'
+        if self._tokens < 1:
+            return 'budget'
+        return None
+
+    @staticmethod
+    async def _snapshot_reason(snapshot, before):
+        try:
+            if await snapshot() != before:
+                return 'snapshot_changed'
+        except Exception:
+            return 'snapshot_unknown'
+        return None
+
+    async def run(self, route, send, snapshot):
+        """|coro|
+        Sends ``route`` with ``send()`` until an attempt succeeds or the
+        policy gives up, and returns the last ``(status, text, headers)``
+        or raises the last exception.
+
+        Parameters:
+            - route - the :class:`Route` sent
+            - send - a function returning a new coroutine sending the route
+            - snapshot - a function returning a coroutine returning the
+              current snapshot_id of the playlist the route changes
+        """
+        start = time.monotonic()
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        mode = self.mode(route)
+        before = None
+        if mode == 'snapshot':
+            try:
+                before = await snapshot()
+            except Exception:
+                mode = None
+        attempt = 0
+        while True:
+            attempt += 1
+            self.attempts[attempt] += 1
+            error = None
+            try:
+                result = await send()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                error, status, reason = e, None, type(e).__name__
+            else:
+                status = reason = result[0]
+                if status not in self.statuses:
+                    return result
+            self.failures[reason] += 1
+
+            delay = self.backoff(attempt)
+            give_up = self._give_up_reason(mode, attempt, status, start, delay)
+            if give_up is None:
+                await asyncio.sleep(delay)
+                # checked after the backoff, a request that timed out on our
+                # side may still have been applied while we slept
+                if mode == 'snapshot' and status != 429:
+                    give_up = await self._snapshot_reason(snapshot, before)
+            if give_up is not None:
+                self.gave_up[give_up] += 1
+                if error is not None:
+                    raise error
+                return result
+            self._tokens -= 1
+            self.retries += 1
@@ -0,0 +1,103 @@
+import asyncio
+
+from .cache import TTLCache
+
+TYPES = ('artist', 'album', 'track', 'playlist')
+# Spotify refuses search pages past this offset
+MAX_OFFSET = 1000
+
+
+def normalize_query(q):
+    """Returns the cache form of a query: case folded, single spaced."""
+    return ' '.join(q.casefold().split())
+
+
+class SearchEngine:
+    """Searches several types at once and caches the results.
+
+    Concurrent identical searches share one request, and results are cached
+    by normalized query, types, market, limit and offset.
+
+    Parameters:
+        - http - the :class:`HTTPClient` to send requests with
+        - ttl - how long a result is cached, in seconds
+        - maxsize - the most results cached
+        - combined - send one request with a comma separated ``type``
+          instead of one request per type
+    """
+
+    def __init__(self, http, ttl=30, maxsize=10000, combined=True):
+        self.http = http
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.combined = combined
+        self._inflight = {}
+
+    async def search(self, q, types=TYPES, limit=10, offset=0, market=None):
+        """|coro|
+        searches for items of several types
+
+        Returns a dict of the paging object of every type, e.g.
+        ``{'artist': {...}, 'track': {...}}``.
+
+        Parameters:
+            - q - the search query
+            - types - the types of item to return, any of 'artist', 'album',
+                      'track' and 'playlist'
+            - limit  - the number of items to return per type
+            - offset - the index of the first item to return
+            - market - An ISO 3166-1 alpha-2 country code or the string from_token.
+        """
+        if isinstance(types, str):
+            types = (types,)
+        if offset > MAX_OFFSET:
+            raise ValueError('Spotify does not return search results past offset %d' % MAX_OFFSET)
+        key = (normalize_query(q), tuple(sorted(types)), market, limit, offset)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._inflight[key] = asyncio.ensure_future(self._fetch(key, q, limit, offset, market))
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # one caller giving up must not cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def _fetch(self, key, q, limit, offset, market):
+        result = await self._request(q, key[1], limit, offset, market)
+        # a market of from_token depends on the user, it must not be shared
+        if market != 'from_token':
+            self.cache.set(key, result)
+        return result
+
+    async def _request(self, q, types, limit, offset, market):
+        if self.combined:
+            result = await self.http.search(q, limit, offset, ','.join(types), market)
+            return {_type: result.get(_type + 's') for _type in types}
+        pages = await asyncio.gather(*[
+            self.http.search(q, limit, offset, _type, market) for _type in types
+        ])
+        return {_type: page.get(_type + 's') for _type, page in zip(types, pages)}
+
+    async def stream(self, q, _type='track', page_size=50, market=None, max_items=None):
+        """Yields the items of one type page by page as they are consumed,
+        up to Spotify's offset limit.
+
+        Parameters:
+            - q - the search query
+            - _type - the type of item to return
+            - page_size - the number of items fetched per request, at most 50
+            - market - An ISO 3166-1 alpha-2 country code or the string from_token.
+            - max_items - stop after this many items
+        """
+        offset = 0
+        while offset <= MAX_OFFSET and (max_items is None or offset < max_items):
+            limit = page_size if max_items is None else min(page_size, max_items - offset)
+            page = (await self.search(q, _type, limit, offset, market))[_type]
+            if not page or not page['items']:
+                return
+            for item in page['items']:
+                yield item
+            offset += len(page['items'])
+            if page.get('next') is None:
+                return
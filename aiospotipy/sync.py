@@ -0,0 +1,137 @@
+import asyncio
+import inspect
+import threading
+
+from .client import Spotify
+
+
+class SyncProxy:
+    """Calls the coroutine methods of an object living on a
+    :class:`SyncSpotify` loop from any thread and waits for the result.
+
+    Async generator methods, e.g. :meth:`SearchEngine.stream`, become plain
+    generators fetching one item at a time. Other attributes are returned
+    as they are.
+    """
+
+    __slots__ = ('_target', '_client')
+
+    def __init__(self, target, client):
+        self._target = target
+        self._client = client
+
+    def __repr__(self):
+        return '<SyncProxy of %r>' % (self._target,)
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if inspect.iscoroutinefunction(attr):
+            def call(*args, **kwargs):
+                return self._client.run(attr(*args, **kwargs))
+        elif inspect.isasyncgenfunction(attr):
+            def call(*args, **kwargs):
+                return self._client.iterate(attr(*args, **kwargs))
+        else:
+            return attr
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+
+
+class SyncSpotify(SyncProxy):
+    """A blocking :class:`Spotify` client that may be shared by many threads.
+
+    One background thread runs an event loop owning the client, so every
+    calling thread shares its connection pool, cache and rate limiter.
+    Calls are sent to the loop and block the calling thread until they
+    finish.
+
+        spotify = SyncSpotify(client_credentials_manager=credentials)
+        artist = spotify.artist('0OdUWJ0sBjDrqHygGUXeCF')
+        library = spotify.wrap(Library(spotify.client.me))
+        spotify.close()
+
+    Parameters:
+        - call_timeout - the most seconds a call blocks its thread, None to
+          wait forever
+        - other arguments are passed to :class:`Spotify`
+    """
+
+    __slots__ = ('client', 'loop', 'call_timeout', '_thread', 'me')
+
+    def __init__(self, auth=None, client_credentials_manager=None, *, call_timeout=None, **kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.call_timeout = call_timeout
+        self._thread = threading.Thread(target=self._run_loop, name='aiospotipy', daemon=True)
+        self._thread.start()
+        # built on the loop, asyncio primitives of old Pythons bind to the
+        # loop running when they are made
+        try:
+            self.client = self.run(self._make(auth, client_credentials_manager, kwargs))
+        except BaseException:
+            self._stop_loop()
+            raise
+        super().__init__(self.client, self)
+        self.me = SyncProxy(self.client.me, self)
+
+    @staticmethod
+    async def _make(auth, client_credentials_manager, kwargs):
+        return Spotify(auth, client_credentials_manager, **kwargs)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedules a coroutine on the loop and returns a
+        :class:`concurrent.futures.Future` of its result, without waiting."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro):
+        """Runs a coroutine on the loop and returns its result."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError('SyncSpotify must not be called from its own loop')
+        future = self.submit(coro)
+        try:
+            return future.result(self.call_timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, agen):
+        """Yields the items of an async generator, fetching one item per
+        step on the loop."""
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if self.loop.is_running():
+                self.run(agen.aclose())
+
+    def wrap(self, obj):
+        """Returns a :class:`SyncProxy` of ``obj``, e.g. a :class:`Library`
+        or :class:`SearchEngine` built on ``self.client``."""
+        return SyncProxy(obj, self)
+
+    def close(self):
+        """Closes the client and stops the loop thread."""
+        if not self.loop.is_running():
+            return
+        try:
+            self.run(self.client.close())
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
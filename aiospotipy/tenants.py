@@ -0,0 +1,158 @@
+import contextlib
+import contextvars
+
+from ._http import SpotifyException
+from .ratelimit import RateLimiter
+
+_tenant = contextvars.ContextVar('aiospotipy_tenant', default=None)
+
+
+@contextlib.contextmanager
+def tenant(name):
+    """Tags every request made inside the block with the tenant ``name``.
+
+        with tenant('charts-team'):
+            await spotify.new_releases('JP')
+    """
+    token = _tenant.set(name)
+    try:
+        yield
+    finally:
+        _tenant.reset(token)
+
+
+def current_tenant():
+    return _tenant.get()
+
+
+class QuotaExceeded(SpotifyException):
+    """Raised instead of queueing a request when its tenant already has
+    ``max_queue`` requests waiting for its quota."""
+
+    def __init__(self, tenant, waiting):
+        super().__init__(429, -1, 'tenant %s has %d requests waiting for its quota' % (tenant, waiting))
+        self.tenant = tenant
+        self.waiting = waiting
+
+
+class _Tenant:
+    __slots__ = ('name', 'limiter', 'max_queue', 'waiting', 'requests', 'shed', 'responses', 'wire_bytes',
+                 'decoded_bytes')
+
+    def __init__(self, name, limiter, max_queue):
+        self.name = name
+        self.limiter = limiter
+        self.max_queue = max_queue
+        self.waiting = 0
+        self.requests = 0
+        self.shed = 0
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+
+class _Admission:
+    __slots__ = ('tenant',)
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    async def __aenter__(self):
+        tenant = self.tenant
+        if tenant.limiter is None:
+            tenant.requests += 1
+            return
+        if tenant.max_queue is not None and tenant.waiting >= tenant.max_queue:
+            tenant.shed += 1
+            raise QuotaExceeded(tenant.name, tenant.waiting)
+        tenant.waiting += 1
+        try:
+            await tenant.limiter.acquire()
+        finally:
+            tenant.waiting -= 1
+        tenant.requests += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.tenant.limiter is not None:
+            self.tenant.limiter.release()
+
+
+class TenantScheduler:
+    """Counts requests and bytes per tenant and holds each tenant to its own
+    quota before its requests reach the client's shared rate limiter, so a
+    tenant over its quota waits in its own line without slowing the others.
+
+    Requests are tagged with :func:`tenant`; untagged requests belong to
+    ``untagged``. Responses served from the cache do not count against a
+    quota.
+
+    Parameters:
+        - quotas - ``{tenant: quota}``, a quota being a dict of the
+          arguments of :meth:`set_quota`
+        - default - the quota of tenants not in ``quotas``, None for no limit
+        - untagged - the tenant of untagged requests
+    """
+
+    def __init__(self, quotas=None, default=None, untagged='default'):
+        self.default = default
+        self.untagged = untagged
+        self._quotas = {}
+        self._tenants = {}
+        for name, quota in (quotas or {}).items():
+            self.set_quota(name, **quota)
+
+    def set_quota(self, name, rate=None, per=1.0, burst=1, max_concurrency=None, max_queue=None):
+        """Sets the quota of a tenant.
+
+        Parameters:
+            - name - the tenant
+            - rate - the requests per ``per`` seconds, None for no limit
+            - per - the period of ``rate`` in seconds
+            - burst - how many requests may go out back to back
+            - max_concurrency - the requests in flight, None for no limit
+            - max_queue - the requests that may wait for the quota, more
+              are refused with :class:`QuotaExceeded`; None to queue all
+        """
+        self._quotas[name] = dict(rate=rate, per=per, burst=burst, max_concurrency=max_concurrency,
+                                  max_queue=max_queue)
+        self._tenants.pop(name, None)
+
+    def _get(self, name):
+        if name is None:
+            name = self.untagged
+        tenant = self._tenants.get(name)
+        if tenant is None:
+            quota = self._quotas.get(name, self.default)
+            if quota is None:
+                tenant = _Tenant(name, None, None)
+            else:
+                quota = dict(quota)
+                max_queue = quota.pop('max_queue', None)
+                tenant = _Tenant(name, RateLimiter(**quota), max_queue)
+            self._tenants[name] = tenant
+        return tenant
+
+    def admit(self):
+        """Returns an async context manager holding a slot of the current
+        tenant's quota."""
+        return _Admission(self._get(_tenant.get()))
+
+    def record(self, wire, decoded):
+        """Counts a response of the current tenant."""
+        tenant = self._get(_tenant.get())
+        tenant.responses += 1
+        tenant.wire_bytes += wire
+        tenant.decoded_bytes += decoded
+
+    def stats(self):
+        return {
+            name: {
+                'requests': tenant.requests,
+                'responses': tenant.responses,
+                'wire_bytes': tenant.wire_bytes,
+                'decoded_bytes': tenant.decoded_bytes,
+                'waiting': tenant.waiting,
+                'shed': tenant.shed,
+            }
+            for name, tenant in self._tenants.items()
+        }
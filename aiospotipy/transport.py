@@ -0,0 +1,172 @@
+import asyncio
+import collections
+
+import aiohttp
+
+from .compression import decompress
+
+Response = collections.namedtuple('Response', 'status headers body wire charset')
+Response.__doc__ = """A response read by a transport. ``body`` is decompressed,
+``wire`` is the number of bytes received for it."""
+
+
+def _charset(content_type):
+    for parameter in (content_type or '').split(';')[1:]:
+        key, _, value = parameter.strip().partition('=')
+        if key.lower() == 'charset':
+            return value.strip('"') or None
+    return None
+
+
+class AiohttpTransport:
+    """Sends requests over HTTP/1.1 with an :class:`aiohttp.ClientSession`
+    connection pool. The default transport of :class:`HTTPClient`.
+
+    Parameters:
+        - connector - the :class:`aiohttp.BaseConnector` of the session
+        - session - a session to use instead of creating one, it is not
+          closed by :meth:`close`
+        - proxy - the proxy URL requests are sent through
+    """
+
+    def __init__(self, connector=None, session=None, proxy=None):
+        self.connector = connector
+        self.proxy = proxy
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self):
+        """The :class:`aiohttp.ClientSession` whose connection pool every
+        request goes through, created on first use."""
+        if self._session is None or self._session.closed:
+            # bodies are decompressed here, to count their wire size
+            self._session = aiohttp.ClientSession(connector=self.connector, auto_decompress=False)
+            self._owns_session = True
+        return self._session
+
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        """|coro|
+        sends a request and returns its :class:`Response`
+
+        Parameters:
+            - on_headers - called with the response headers before the body
+              is read
+        """
+        session = self.session
+        kwargs = {} if timeout is None else {'timeout': timeout}
+        async with session.request(method, url, headers=headers, params=params, data=data,
+                                   proxy=self.proxy, **kwargs) as r:
+            if on_headers is not None:
+                on_headers(r.headers)
+            body = await r.read()
+            if getattr(session, 'auto_decompress', True):
+                # a session given by the caller may have decompressed the
+                # body already, Content-Length is then the wire size
+                wire = int(r.headers.get('Content-Length', len(body)))
+            else:
+                wire = len(body)
+                body = decompress(body, r.headers.get('Content-Encoding'))
+            return Response(r.status, r.headers, body, wire, r.charset)
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+
+class _TotalTimeout:
+    """Cancels the current task after ``total`` seconds and raises
+    :class:`asyncio.TimeoutError` instead, with a timer like the one
+    aiohttp uses for ``ClientTimeout.total`` and no task of its own."""
+
+    __slots__ = ('total', '_task', '_handle', '_expired')
+
+    def __init__(self, total):
+        self.total = total
+        self._task = None
+        self._handle = None
+        self._expired = False
+
+    def _expire(self):
+        self._expired = True
+        self._task.cancel()
+
+    def __enter__(self):
+        if self.total is not None:
+            self._task = asyncio.current_task()
+            self._handle = asyncio.get_running_loop().call_later(self.total, self._expire)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._handle is not None:
+            self._handle.cancel()
+        if exc_type is asyncio.CancelledError and self._expired:
+            if hasattr(self._task, 'uncancel'):
+                self._task.uncancel()
+            raise asyncio.TimeoutError() from None
+
+
+class HTTPXTransport:
+    """Sends requests with an :class:`httpx.AsyncClient`, multiplexing them
+    over a few HTTP/2 connections. Needs ``httpx[http2]``.
+
+    Connection errors and timeouts are raised as
+    :class:`aiohttp.ClientConnectionError` and :class:`asyncio.TimeoutError`,
+    so retries and the circuit breaker treat them like those of the
+    default transport. The ``connect`` and ``sock_read`` parts of a
+    :class:`aiohttp.ClientTimeout` become the pool and read timeouts of
+    httpx, ``sock_connect`` its connect timeout.
+
+    Parameters:
+        - http2 - whether to use HTTP/2
+        - proxy - the proxy URL requests are sent through
+        - client - an :class:`httpx.AsyncClient` to use instead of creating
+          one, it is not closed by :meth:`close`
+        - other keyword arguments are passed to :class:`httpx.AsyncClient`
+    """
+
+    def __init__(self, http2=True, proxy=None, client=None, **kwargs):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError('HTTPXTransport needs httpx, install aiospotipy[http2]') from None
+        if client is not None and (proxy is not None or kwargs):
+            raise ValueError('proxy and client options cannot be used with a client given to HTTPXTransport')
+        self.httpx = httpx
+        self._owns_client = client is None
+        if client is None:
+            if proxy is not None:
+                kwargs['proxy'] = proxy
+            client = httpx.AsyncClient(http2=http2, timeout=None, **kwargs)
+        self.client = client
+
+    def _timeout(self, timeout):
+        if timeout is None:
+            return None
+        connect = timeout.sock_connect if timeout.sock_connect is not None else timeout.connect
+        return self.httpx.Timeout(None, connect=connect, read=timeout.sock_read, pool=timeout.connect)
+
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        """|coro|
+        sends a request and returns its :class:`Response`, see
+        :meth:`AiohttpTransport.request`
+        """
+        httpx = self.httpx
+        try:
+            with _TotalTimeout(None if timeout is None else timeout.total):
+                async with self.client.stream(method, url, headers=headers, params=params, content=data,
+                                              timeout=self._timeout(timeout)) as r:
+                    if on_headers is not None:
+                        on_headers(r.headers)
+                    raw = b''.join([chunk async for chunk in r.aiter_raw()])
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError() from e
+        except httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+        body = decompress(raw, r.headers.get('Content-Encoding'))
+        return Response(r.status_code, r.headers, body, len(raw), _charset(r.headers.get('Content-Type')))
+
+    async def close(self):
+        if self._owns_client:
+            await self.client.aclose()
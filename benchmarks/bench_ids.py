@@ -0,0 +1,57 @@
+"""Times ID normalization over a million mixed-form IDs.
+
+    python benchmarks/bench_ids.py
+"""
+import random
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from aiospotipy.ids import get_ids, pack_ids, unpack_id, unpack_ids  # noqa: E402
+
+
+def legacy_get_id(_type, _id):
+    fields = _id.split(':')
+    if len(fields) >= 3:
+        return fields[-1]
+    fields = _id.split('/')
+    if len(fields) >= 3:
+        return fields[-1]
+    return _id
+
+
+def make_ids(count, distinct=50000):
+    rng = random.Random(0)
+    pool = [unpack_id(rng.getrandbits(128).to_bytes(16, 'big')) for _ in range(distinct)]
+    forms = [
+        lambda i: i,
+        lambda i: 'spotify:track:' + i,
+        lambda i: 'https://open.spotify.com/track/' + i + '?si=' + i[:16],
+    ]
+    return [rng.choice(forms)(rng.choice(pool)) for _ in range(count)]
+
+
+def timed(name, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print('%-22s %8.3fs' % (name, time.perf_counter() - start))
+    return result
+
+
+def main():
+    ids = make_ids(1000000)
+    # the legacy parser keeps the query string of a URL, so it only gets
+    # the forms it understands
+    timed('legacy get_id', lambda: [legacy_get_id('track', i) for i in ids if '?' not in i])
+    normalized = timed('get_ids (cold cache)', get_ids, 'track', ids)
+    timed('get_ids (warm cache)', get_ids, 'track', ids)
+    packed = timed('pack_ids', pack_ids, 'track', normalized)
+    assert timed('unpack_ids', unpack_ids, packed) == normalized
+    print('%d ids: %d bytes as str, %d bytes packed' % (
+        len(normalized), sum(sys.getsizeof(i) for i in normalized), len(packed)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Times ``import aiospotipy`` in fresh interpreters, and fails if the ID
+utilities pull in aiohttp.
+
+    python benchmarks/bench_import.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+from os import path
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+CASES = [
+    ('python', 'pass'),
+    ('import aiospotipy', 'import aiospotipy'),
+    ('from aiospotipy import get_id', 'from aiospotipy import get_id'),
+    ('from aiospotipy import Spotify', 'from aiospotipy import Spotify'),
+]
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed, 'aiohttp' in sys.modules)
+'''
+
+
+def run(statement):
+    output = subprocess.check_output([sys.executable, '-c', TIMER.format(statement)], cwd=ROOT)
+    elapsed, aiohttp_loaded = output.split()
+    return float(elapsed), aiohttp_loaded == b'True'
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    failed = False
+    for name, statement in CASES:
+        results = [run(statement) for _ in range(runs)]
+        times = [elapsed for elapsed, _ in results]
+        aiohttp_loaded = results[0][1]
+        print('%-32s median %7.2fms  min %7.2fms  aiohttp %s' % (
+            name, statistics.median(times) * 1000, min(times) * 1000,
+            'loaded' if aiohttp_loaded else 'not loaded'))
+        if 'get_id' in statement and aiohttp_loaded:
+            failed = True
+    if failed:
+        print('the ID utilities must not import aiohttp')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Compares the aiohttp HTTP/1.1 pool with the HTTP/2 transport against
+local mock servers answering every request after a fixed delay: sockets
+opened, latency and throughput. Needs ``httpx[http2]``.
+
+    python benchmarks/bench_transport.py [requests] [concurrency] [delay ms]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from aiospotipy._http import HTTPClient  # noqa: E402
+from aiospotipy._tasks import bounded_map  # noqa: E402
+from aiospotipy.endpoints import CATALOG, Route  # noqa: E402
+from aiospotipy.transport import HTTPXTransport  # noqa: E402
+
+TRACK_ID = '0OdUWJ0sBjDrqHygGUXeCF'
+BODY = json.dumps({
+    'id': TRACK_ID, 'name': 'track', 'duration_ms': 200000, 'popularity': 50, 'explicit': False,
+    'artists': [{'id': TRACK_ID, 'name': 'artist'}], 'album': {'id': TRACK_ID, 'name': 'album'},
+    'available_markets': ['JP', 'US', 'GB'] * 20,
+}).encode()
+
+
+class H2Server(asyncio.Protocol):
+    """An HTTP/2 server with prior knowledge, answering every request with
+    :data:`BODY` after ``delay`` seconds."""
+
+    connections = 0
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+
+    def connection_made(self, transport):
+        H2Server.connections += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(self.delay, self.respond, event.stream_id)
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id):
+        if self.transport.is_closing():
+            return
+        self.conn.send_headers(stream_id, [
+            (':status', '200'), ('content-type', 'application/json; charset=utf-8'),
+            ('content-length', str(len(BODY))),
+        ])
+        self.conn.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+async def h1_server(delay, port):
+    peers = set()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        await asyncio.sleep(delay)
+        return web.Response(body=BODY, content_type='application/json')
+
+    app = web.Application()
+    app.router.add_get('/v1/tracks/{id}', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+    return runner, peers
+
+
+async def drive(http, base, count, concurrency):
+    Route.BASE = base
+    route = CATALOG['track'].route(TRACK_ID)
+    latencies = []
+
+    async def one(_):
+        start = time.perf_counter()
+        await http.request(route)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    async for _, _, error in bounded_map(one, range(count), concurrency):
+        if error is not None:
+            raise error
+    elapsed = time.perf_counter() - start
+    await http.close()
+    latencies.sort()
+    return elapsed, latencies
+
+
+def report(name, sockets, count, elapsed, latencies):
+    print('%-18s sockets %4d  %8.0f req/s  p50 %6.2fms  p99 %6.2fms' % (
+        name, sockets, count / elapsed, statistics.median(latencies) * 1000,
+        latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000))
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    delay = (float(sys.argv[3]) if len(sys.argv) > 3 else 5) / 1000
+    loop = asyncio.get_running_loop()
+
+    runner, peers = await h1_server(delay, 18081)
+    h2_server = await loop.create_server(lambda: H2Server(delay), '127.0.0.1', 18082)
+    try:
+        elapsed, latencies = await drive(HTTPClient('token'), 'http://127.0.0.1:18081/v1', count, concurrency)
+        report('aiohttp HTTP/1.1', len(peers), count, elapsed, latencies)
+
+        # http1=False makes httpx speak HTTP/2 to a plain http:// server
+        transport = HTTPXTransport(http2=True, http1=False)
+        elapsed, latencies = await drive(HTTPClient('token', transport=transport), 'http://127.0.0.1:18082/v1',
+                                         count, concurrency)
+        report('httpx HTTP/2', H2Server.connections, count, elapsed, latencies)
+    finally:
+        h2_server.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,243 @@
+"""Profiles the Spotify -> HTTPClient.request hot path without the network.
+
+Every request is answered by an in-process stub transport with a canned
+response for its endpoint. Reports requests per second per core, the CPU
+time spent in each stage (cProfile) and the memory held by requests in
+flight (tracemalloc). Save a run with --json and compare a later one against it
+with --compare to catch hot path regressions.
+
+    python benchmarks/profile_client.py [--requests N] [--json out.json] [--compare base.json]
+"""
+import argparse
+import asyncio
+import cProfile
+import json
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from aiospotipy import Spotify  # noqa: E402
+from aiospotipy.ids import unpack_id  # noqa: E402
+from aiospotipy.transport import Response  # noqa: E402
+
+_rng = random.Random(0)
+IDS = [unpack_id(_rng.getrandbits(120).to_bytes(16, 'big')) for _ in range(2000)]
+
+
+def _track(track_id):
+    return {
+        'id': track_id, 'name': 'track ' + track_id, 'uri': 'spotify:track:' + track_id,
+        'duration_ms': 215000, 'popularity': 61, 'explicit': False, 'track_number': 3, 'disc_number': 1,
+        'external_ids': {'isrc': 'JPABC1900001'},
+        'artists': [{'id': IDS[0], 'name': 'artist', 'uri': 'spotify:artist:' + IDS[0]}],
+        'album': {'id': IDS[1], 'name': 'album', 'album_type': 'album', 'release_date': '2019-01-01'},
+        'available_markets': ['JP', 'US', 'GB', 'DE', 'FR'] * 16,
+    }
+
+
+def _canned():
+    """Returns ``[(url path fragment, body)]``, the most specific first."""
+    track = _track(IDS[2])
+    return [
+        ('/top-tracks', {'tracks': [_track(i) for i in IDS[:10]]}),
+        ('/playlists/', {'items': [{'added_at': '2019-01-01T00:00:00Z', 'track': _track(i)} for i in IDS[:100]],
+                         'next': None, 'total': 100, 'limit': 100, 'offset': 0}),
+        ('/audio-features', {'audio_features': [{'id': i, 'energy': 0.5, 'tempo': 120.0} for i in IDS[:100]]}),
+        ('/search', {'tracks': {'items': [_track(i) for i in IDS[:20]], 'next': None, 'total': 20}}),
+        ('/tracks/', track),
+        ('/artists/', {'id': IDS[0], 'name': 'artist', 'genres': ['j-pop'], 'popularity': 70}),
+        ('/albums/', {'id': IDS[1], 'name': 'album', 'tracks': {'items': [_track(i) for i in IDS[:12]]}}),
+        ('/users/', {'id': 'user', 'display_name': 'user'}),
+        ('/tracks', {'tracks': [_track(i) for i in IDS[:50]]}),
+    ]
+
+
+RESPONSES = [(fragment, json.dumps(body).encode()) for fragment, body in _canned()]
+
+
+class StubTransport:
+    """Answers every request at once with the canned body of its endpoint."""
+
+    def __init__(self):
+        self.responses = RESPONSES
+        self.headers = {'Content-Type': 'application/json; charset=utf-8'}
+        self.requests = 0
+
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        self.requests += 1
+        for fragment, body in self.responses:
+            if fragment in url:
+                if on_headers is not None:
+                    on_headers(self.headers)
+                return Response(200, self.headers, body, len(body), 'utf-8')
+        raise LookupError('no canned response for %s' % url)
+
+    async def close(self):
+        pass
+
+
+def workload(count):
+    """Returns ``count`` calls of a fixed mix of endpoints, each a function
+    of the client returning a coroutine."""
+    rng = random.Random(1)
+    mix = [
+        (25, lambda s, i: s.track(i)),
+        (15, lambda s, i: s.track('spotify:track:' + i)),
+        (10, lambda s, i: s.artist('https://open.spotify.com/artist/' + i + '?si=x')),
+        (10, lambda s, i: s.artist_top_tracks(i, 'JP')),
+        (10, lambda s, i: s.album(i)),
+        (10, lambda s, i: s.get_playlist_tracks('user', i)),
+        (5, lambda s, i: s.tracks(IDS[:50])),
+        (5, lambda s, i: s.audio_features(IDS[:100])),
+        (5, lambda s, i: s.search('artist ' + i[:4])),
+        (5, lambda s, i: s.user('user')),
+    ]
+    weights = [weight for weight, _ in mix]
+    calls = [call for _, call in mix]
+    return [(rng.choices(calls, weights)[0], rng.choice(IDS)) for _ in range(count)]
+
+
+CONCURRENCY = 50
+
+
+async def drive(calls, concurrency=CONCURRENCY, halfway=None):
+    spotify = Spotify('token', transport=StubTransport())
+    queue = enumerate(calls)
+    half = len(calls) // 2
+
+    async def worker():
+        for index, (call, _id) in queue:
+            if index == half and halfway is not None:
+                halfway()
+            await call(spotify, _id)
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    await spotify.close()
+
+
+# (stage, file suffix, function names); cumulative CPU time of the functions
+STAGES = [
+    ('request total', 'aiospotipy/_http.py', {'request'}),
+    ('route building', 'aiospotipy/endpoints.py', {'route', 'compiled', 'make'}),
+    ('id parsing', 'aiospotipy/ids.py', {'get_id', 'get_ids', 'parse_id'}),
+    ('auth headers', 'aiospotipy/_http.py', {'auth_headers'}),
+    ('rate limiting', 'aiospotipy/ratelimit.py', {'acquire', 'release'}),
+    ('transport', 'profile_client.py', {'request'}),
+    ('body decode', 'aiospotipy/_http.py', {'decode'}),
+    ('json parsing', 'json/__init__.py', {'loads'}),
+    ('json encoding', 'json/__init__.py', {'dumps'}),
+    ('asyncio', 'asyncio/', None),
+]
+
+
+def stage_times(stats):
+    times = dict.fromkeys([name for name, _, _ in STAGES], 0.0)
+    for (filename, _, function), (_, _, tottime, cumtime, _) in stats.stats.items():
+        filename = filename.replace('\\', '/')
+        for name, suffix, functions in STAGES:
+            if functions is None:
+                if suffix in filename:
+                    times[name] += tottime
+            elif filename.endswith(suffix) and function in functions:
+                times[name] += cumtime
+    return times
+
+
+def measure(count, repeat):
+    calls = workload(count)
+    asyncio.run(drive(calls))  # warms the imports and the ID cache
+
+    cpu = wall = float('inf')
+    for _ in range(repeat):
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        asyncio.run(drive(calls))
+        cpu = min(cpu, time.process_time() - cpu_start)
+        wall = min(wall, time.perf_counter() - wall_start)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    asyncio.run(drive(calls))
+    profiler.disable()
+    stats = pstats.Stats(profiler)
+    stages = stage_times(stats)
+
+    # the memory held by the requests in flight, halfway through a run
+    snapshots = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    asyncio.run(drive(calls, halfway=lambda: snapshots.append(tracemalloc.take_snapshot())))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    in_flight = snapshots[0].compare_to(before, 'lineno')
+    held = sum(stat.size_diff for stat in in_flight if stat.size_diff > 0)
+    top = [(str(stat.traceback[0]), stat.count_diff, stat.size_diff) for stat in in_flight[:10]]
+
+    return {
+        'requests': count,
+        'cpu_seconds': cpu,
+        'wall_seconds': wall,
+        'requests_per_cpu_second': count / cpu,
+        'profiled_total': stats.total_tt,
+        'stages_us_per_request': {name: seconds / count * 1e6 for name, seconds in stages.items()},
+        # shares of the request total vary less between machines and runs
+        'stages_share': {name: seconds / stages['request total'] for name, seconds in stages.items()},
+        'held_bytes_per_request_in_flight': held / CONCURRENCY,
+        'peak_traced_bytes': peak,
+        'top_allocations': top,
+    }, stats
+
+
+def report(result, base=None):
+    def delta(key, value, base_values):
+        if base_values is None or key not in base_values or not base_values[key]:
+            return ''
+        return '  %+6.1f%%' % ((value - base_values[key]) / base_values[key] * 100)
+
+    print('%d requests, %.2fs CPU, %.0f requests per CPU second per core%s' % (
+        result['requests'], result['cpu_seconds'], result['requests_per_cpu_second'],
+        delta('requests_per_cpu_second', result['requests_per_cpu_second'], base)))
+    print('\nCPU per request by stage (cProfile, cumulative), and share of the request total:')
+    base_shares = base and base.get('stages_share')
+    for name, value in result['stages_us_per_request'].items():
+        share = result['stages_share'][name]
+        print('  %-16s %9.1fus %6.1f%%%s' % (name, value, share * 100, delta(name, share, base_shares)))
+    print('\nmemory: %.0f bytes held per request in flight%s, %d bytes peak traced%s' % (
+        result['held_bytes_per_request_in_flight'],
+        delta('held_bytes_per_request_in_flight', result['held_bytes_per_request_in_flight'], base),
+        result['peak_traced_bytes'], delta('peak_traced_bytes', result['peak_traced_bytes'], base)))
+    print('\ntop allocations held halfway through the run:')
+    for where, count, size in result['top_allocations']:
+        print('  %-60s %+8d blocks %+10d bytes' % (where[-60:], count, size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs, the fastest is kept')
+    parser.add_argument('--json', help='save the results to this file')
+    parser.add_argument('--compare', help='show the change from the results saved in this file')
+    parser.add_argument('--functions', type=int, default=0, help='also print the N most expensive functions')
+    args = parser.parse_args()
+
+    result, stats = measure(args.requests, args.repeat)
+    base = None
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+    report(result, base)
+    if args.functions:
+        print()
+        stats.sort_stats('tottime').print_stats(args.functions)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
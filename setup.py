@@ -13,20 +13,24 @@ setup(
     long_description=open('README.md').read(),
     long_description_content_type="text/markdown",
     author='sizumita',
-    install_requires=['aiohttp'],
+    install_requires=['aiohttp>=3.7.0'],
+    extras_require={'arrow': ['pyarrow>=8.0'], 'brotli': ['brotli'], 'http2': ['httpx[http2]>=0.26']},
     url='https://github.com/sizumita/aiospotipy',
     license="MIT",
     packages=find_packages(),
-    python_requires='>=3.5.3',
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 4 - Beta',
         'License :: OSI Approved :: MIT License',
         'Intended Audience :: Developers',
         'Natural Language :: Japanese',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Internet',
         'Topic :: Software Development :: Libraries',
         'Topic :: Software Development :: Libraries :: Python Modules',
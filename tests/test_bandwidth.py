@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from aiospotipy._http import HTTPClient
+from aiospotipy.budget import MemoryBudget
+from aiospotipy.endpoints import Route
+from aiospotipy.transport import Response
+
+PLAYLIST_ID = '37i9dQZF1DXcBWIGoYBM5M'
+NEXT = Route.BASE + '/users/spotify/playlists/%s/tracks?offset=100&limit=100' % PLAYLIST_ID
+
+
+class StubTransport:
+    """Answers the first page of a playlist's tracks with a link to a second one."""
+
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        body = json.dumps({'items': [], 'next': None if 'offset=' in url else NEXT}).encode()
+        return Response(200, {}, body, len(body), 'utf-8')
+
+    async def close(self):
+        pass
+
+
+def test_next_pages_are_counted_under_their_endpoint():
+    async def run():
+        budget = MemoryBudget()
+        http = HTTPClient('token', transport=StubTransport(), memory_budget=budget)
+        page = await http.get_playlist_tracks('spotify', PLAYLIST_ID)
+        assert await http.next(page) is not None
+        await http.close()
+        return http.bandwidth.stats(), budget.stats()['estimates']
+
+    bandwidth, estimates = asyncio.run(run())
+    assert list(bandwidth) == ['get_playlist_tracks']
+    assert list(estimates) == ['get_playlist_tracks']
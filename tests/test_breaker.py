@@ -0,0 +1,19 @@
+from aiospotipy.endpoints import CATALOG, GET, Route
+
+PLAYLIST_ID = '37i9dQZF1DXcBWIGoYBM5M'
+
+
+def test_user_endpoints_have_their_own_families():
+    families = {
+        CATALOG['user'].route('spotify').family,
+        CATALOG['playlist_create'].route('spotify', 'name').family,
+        CATALOG['get_playlist_tracks'].route('spotify', PLAYLIST_ID).family,
+        CATALOG['playlist_is_following'].route('spotify', PLAYLIST_ID, ['spotify']).family,
+    }
+    assert families == {'users', 'users/playlists', 'users/playlists/tracks', 'users/playlists/followers/contains'}
+
+
+def test_next_page_route_gets_its_endpoint_family():
+    url = Route.BASE + '/users/spotify/playlists/%s/tracks?offset=100&limit=100' % PLAYLIST_ID
+    assert Route(GET, url).family == 'users/playlists/tracks'
+    assert Route(GET, '/recommendations', seed_genres='j-pop').family == 'recommendations'
@@ -0,0 +1,36 @@
+import asyncio
+
+from aiospotipy.bulk import BulkExecutor
+
+
+def sleeper(seconds, value):
+    async def call():
+        await asyncio.sleep(seconds)
+        return value
+    return call
+
+
+def test_deadline_fails_slow_calls_only():
+    async def run():
+        calls = [sleeper(0, 'fast'), sleeper(1, 'slow'), asyncio.Event().wait]
+        return await BulkExecutor(None).gather(calls, deadline=0.05)
+
+    fast, slow, event = asyncio.run(run())
+    assert fast == 'fast'
+    assert isinstance(slow, asyncio.TimeoutError) and isinstance(event, asyncio.TimeoutError)
+
+
+def test_second_run_does_not_undo_cancel():
+    async def run():
+        executor = BulkExecutor(None, concurrency=1)
+        first = executor.run([sleeper(1, 1), sleeper(0, 2)])
+        started = asyncio.ensure_future(first.__anext__())
+        await asyncio.sleep(0.01)
+        executor.cancel()
+        second = await executor.gather([sleeper(0, 'second')])
+        results = [await started] + [result async for result in first]
+        return second, results
+
+    second, results = asyncio.run(run())
+    assert second == ['second']
+    assert all(isinstance(result.error, asyncio.CancelledError) for result in results)
@@ -0,0 +1,64 @@
+import asyncio
+
+from aiospotipy.crawler import DiscographyCrawler
+from aiospotipy.ids import unpack_id
+
+ARTISTS = [unpack_id(bytes([1, n]) + bytes(14)) for n in range(6)]
+ALBUMS = {artist: [unpack_id(bytes([2, a, n]) + bytes(13)) for n in range(25)]
+          for a, artist in enumerate(ARTISTS)}
+
+
+class StubHTTP:
+    """Answers the crawler's requests from :data:`ARTISTS` and :data:`ALBUMS`."""
+
+    async def artist(self, artist_id):
+        await asyncio.sleep(0)
+        return {'id': artist_id}
+
+    async def artist_related_artists(self, artist_id):
+        return {'artists': []}
+
+    async def artist_albums(self, artist_id, album_type=None, country=None, limit=50):
+        await asyncio.sleep(0)
+        return {'items': [{'id': album_id} for album_id in ALBUMS[artist_id]], 'next': None}
+
+    async def next(self, page):
+        return None
+
+    async def albums(self, album_ids):
+        await asyncio.sleep(0)
+        return {'albums': [{'id': album_id, 'tracks': {'items': [], 'next': None}} for album_id in album_ids]}
+
+
+async def collect(crawler):
+    return [item.id async for item in crawler.crawl(ARTISTS) if item.kind == 'album']
+
+
+def test_resume_emits_every_album(tmp_path):
+    checkpoint = str(tmp_path / 'crawl.json')
+
+    async def run():
+        first = DiscographyCrawler(StubHTTP(), max_depth=0, checkpoint=checkpoint)
+        crawl = first.crawl(ARTISTS)
+        albums = []
+        yielded = 0
+        async for item in crawl:
+            yielded += 1
+            if item.kind == 'album':
+                albums.append(item.id)
+            if yielded == 20:
+                break
+        assert first._out.qsize()
+        await crawl.aclose()
+
+        second = DiscographyCrawler(StubHTTP(), max_depth=0, checkpoint=checkpoint)
+        albums += await collect(second)
+        return albums
+
+    albums = asyncio.run(run())
+    assert set(albums) == {album_id for ids in ALBUMS.values() for album_id in ids}
+
+
+def test_crawl_without_checkpoint():
+    albums = asyncio.run(collect(DiscographyCrawler(StubHTTP(), max_depth=0)))
+    assert sorted(albums) == sorted(album_id for ids in ALBUMS.values() for album_id in ids)
@@ -0,0 +1,71 @@
+import asyncio
+import io
+import json
+
+from aiospotipy.crawler import CrawlItem
+from aiospotipy.export import NDJSONSink, flatten_audio_features
+
+ALBUM = {'id': 'album1', 'name': 'album', 'album_type': 'album', 'release_date': '2019-01-01'}
+
+
+def track(track_id, album=ALBUM):
+    return {'id': track_id, 'name': 'track ' + track_id, 'duration_ms': 200000,
+            'artists': [{'id': 'artist1', 'name': 'artist'}], 'album': album}
+
+
+def rows(chunk, **kwargs):
+    out = io.StringIO()
+    with NDJSONSink(out, **kwargs) as sink:
+        written = sink.write(chunk)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert written == len(lines)
+    return lines
+
+
+def test_single_track():
+    assert [row['track_id'] for row in rows(track('t1'))] == ['t1']
+
+
+def test_list_of_tracks():
+    assert [row['track_id'] for row in rows([track('t1'), None, track('t2')])] == ['t1', 't2']
+
+
+def test_paging_object():
+    page = {'items': [{'added_at': '2019-01-01T00:00:00Z', 'track': track('t1')}, {'track': None}], 'next': None}
+    assert [(row['track_id'], row['added_at']) for row in rows(page)] == [('t1', '2019-01-01T00:00:00Z')]
+
+
+def test_tracks_response():
+    written = rows({'tracks': [track('t1'), None, track('t2')]})
+    assert [(row['track_id'], row['album_id']) for row in written] == [('t1', 'album1'), ('t2', 'album1')]
+
+
+def test_search_response():
+    assert [row['track_id'] for row in rows({'tracks': {'items': [track('t1')], 'next': None}})] == ['t1']
+
+
+def test_audio_features_response():
+    response = {'audio_features': [{'id': 't1', 'energy': 0.5}, None]}
+    assert [(row['id'], row['energy']) for row in rows(response, flatten=flatten_audio_features)] == [('t1', 0.5)]
+
+
+def test_crawl_items():
+    album = dict(ALBUM, tracks={'items': [track('t1', album=None), track('t2', album=None)], 'next': 'x'})
+    items = [
+        CrawlItem('artist', 'artist1', 0, {'id': 'artist1'}),
+        CrawlItem('album', 'album1', 0, album),
+        CrawlItem('album_tracks', 'album1', 0, [track('t3', album=None)]),
+        CrawlItem('error', 'album2', 0, RuntimeError('500')),
+    ]
+
+    async def crawl():
+        for item in items:
+            yield item
+
+    out = io.StringIO()
+    with NDJSONSink(out) as sink:
+        assert asyncio.run(sink.consume(crawl())) == 3
+    written = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(row['track_id'], row['album_id']) for row in written] == [
+        ('t1', 'album1'), ('t2', 'album1'), ('t3', 'album1')]
+    assert written[0]['album_name'] == 'album'
@@ -0,0 +1,55 @@
+import asyncio
+
+from aiospotipy.feed import PlaylistFeed
+
+PLAYLIST = '37i9dQZF1DXcBWIGoYBM5M'
+
+
+class StubHTTP:
+    """Serves one playlist at ``snapshot``; its tracks fail while ``broken``."""
+
+    def __init__(self):
+        self.snapshot = 's1'
+        self.uris = ['spotify:track:a']
+        self.broken = False
+
+    async def request_if_changed(self, route, etag=None):
+        if etag == self.snapshot:
+            return etag, None
+        return self.snapshot, {'snapshot_id': self.snapshot}
+
+    async def get_playlist_tracks(self, user, playlist_id, fields=None, limit=100):
+        if self.broken:
+            raise RuntimeError('500')
+        return {'items': [{'track': {'uri': uri}} for uri in self.uris], 'next': None}
+
+    async def next(self, page):
+        return None
+
+
+async def poll(feed):
+    for watched in feed.playlists.values():
+        watched.due = 0
+    return [change async for change in feed.poll()]
+
+
+def test_change_reported_after_failed_track_fetch():
+    async def run():
+        http = StubHTTP()
+        feed = PlaylistFeed(http, min_interval=60)
+        feed.watch('user', PLAYLIST, 's1', ['spotify:track:a'])
+        assert await poll(feed) == []
+
+        http.snapshot = 's2'
+        http.uris = ['spotify:track:a', 'spotify:track:b']
+        http.broken = True
+        assert await poll(feed) == []
+        assert await poll(feed) == []
+        assert feed.playlists[PLAYLIST].snapshot_id == 's1'
+
+        http.broken = False
+        changes = await poll(feed)
+        assert [(c.snapshot_id, c.added) for c in changes] == [('s2', [('spotify:track:b', 1)])]
+        assert await poll(feed) == []
+
+    asyncio.run(run())
@@ -0,0 +1,16 @@
+import asyncio
+
+from aiospotipy.ratelimit import RateLimiter
+
+
+def test_limiter_built_outside_a_loop_works_in_several_loops():
+    limiter = RateLimiter(max_concurrency=2)
+
+    async def run():
+        async def one():
+            async with limiter:
+                await asyncio.sleep(0.01)
+        await asyncio.gather(*[one() for _ in range(5)])
+
+    asyncio.run(run())
+    assert limiter.requests == 5 and limiter.in_flight == 0
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from aiospotipy.recommendations import RecommendationEngine
+
+ARTIST_ID = '7k73EtZwoPs516ZxE72KsO'
+
+
+class StubHTTP:
+    """Recommends one track named after the seed, and fails for ``bad``."""
+
+    async def recommendation_genre_seeds(self):
+        return {'genres': ['j-pop', 'rock']}
+
+    async def recommendations(self, seed_artists=None, seed_genres=None, seed_tracks=None, **params):
+        if seed_genres == 'rock':
+            raise RuntimeError('500')
+        seed = seed_artists or seed_genres
+        return {'tracks': [{'id': seed if isinstance(seed, str) else seed[0]}]}
+
+
+def test_validate_counts_string_and_none_seeds():
+    engine = RecommendationEngine(StubHTTP())
+    engine.validate({'seed_artists': ARTIST_ID}, frozenset())
+    engine.validate({'seed_artists': None, 'seed_genres': 'j-pop'}, frozenset({'j-pop'}))
+    with pytest.raises(ValueError):
+        engine.validate({'seed_artists': None, 'seed_tracks': None}, frozenset())
+    with pytest.raises(ValueError):
+        engine.validate({'seed_artists': [ARTIST_ID] * 6}, frozenset())
+
+
+def test_failed_seed_set_does_not_stop_the_stream():
+    async def run():
+        engine = RecommendationEngine(StubHTTP())
+        seed_sets = [{'seed_artists': ARTIST_ID}, {'seed_genres': 'rock'}, {'seed_genres': ['j-pop']}]
+        results = sorted([result async for result in engine.stream(seed_sets)], key=lambda r: r.index)
+        assert [r.result and r.result[0]['id'] for r in results] == [ARTIST_ID, None, 'j-pop']
+        assert isinstance(results[1].error, RuntimeError)
+
+        gathered = await engine.gather(seed_sets, return_exceptions=True)
+        assert isinstance(gathered[1], RuntimeError)
+        with pytest.raises(RuntimeError):
+            await engine.gather(seed_sets)
+
+    asyncio.run(run())
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from aiospotipy._http import HTTPClient, SpotifyException
+from aiospotipy.retry import RetryPolicy
+from aiospotipy.transport import Response
+
+TRACK_ID = '0OdUWJ0sBjDrqHygGUXeCF'
+
+
+class StubTransport:
+    """Answers every request with ``status`` and ``body``."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.requests = 0
+
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        self.requests += 1
+        return Response(self.status, {'Content-Type': 'text/html'}, self.body, len(self.body), 'utf-8')
+
+    async def close(self):
+        pass
+
+
+def test_non_json_5xx_raises_spotify_exception_after_retries():
+    async def run():
+        transport = StubTransport(502, b'<html>bad gateway</html>')
+        http = HTTPClient('token', transport=transport, retry=RetryPolicy(max_attempts=3, base_delay=0))
+        with pytest.raises(SpotifyException) as info:
+            await http.track(TRACK_ID)
+        await http.close()
+        return transport, info.value
+
+    transport, error = asyncio.run(run())
+    assert transport.requests == 3
+    assert error.http_status == 502 and 'bad gateway' in error.msg
+
+
+class Playlist:
+    """A playlist whose ``add`` fails with 503 ``failures`` times; with
+    ``applied_late`` the failed adds still change it a moment later."""
+
+    def __init__(self, failures, applied_late):
+        self.failures = failures
+        self.applied_late = applied_late
+        self.snapshot_id = 's1'
+        self.adds = 0
+
+    def apply(self):
+        self.adds += 1
+        self.snapshot_id = 's%d' % (self.adds + 1)
+
+    async def add(self):
+        if self.failures:
+            self.failures -= 1
+            if self.applied_late:
+                asyncio.get_running_loop().call_soon(self.apply)
+            return 503, '', {}
+        self.apply()
+        return 201, '{"snapshot_id": "%s"}' % self.snapshot_id, {}
+
+    async def snapshot(self):
+        return self.snapshot_id
+
+
+def add_tracks(playlist):
+    route = HTTPClient.playlist_add_tracks.endpoint.route('user', '37i9dQZF1DXcBWIGoYBM5M', [TRACK_ID])
+    policy = RetryPolicy(base_delay=0.01)
+    result = asyncio.run(policy.run(route, playlist.add, playlist.snapshot))
+    return policy, result
+
+
+def test_add_tracks_retried_while_snapshot_unchanged():
+    playlist = Playlist(failures=1, applied_late=False)
+    policy, (status, _, _) = add_tracks(playlist)
+    assert status == 201 and playlist.adds == 1 and policy.retries == 1
+
+
+def test_add_tracks_not_retried_once_snapshot_changed():
+    playlist = Playlist(failures=1, applied_late=True)
+    policy, (status, _, _) = add_tracks(playlist)
+    assert status == 503 and playlist.adds == 1
+    assert policy.gave_up['snapshot_changed'] == 1 and policy.retries == 0
@@ -0,0 +1,13 @@
+import threading
+
+import pytest
+
+from aiospotipy.sync import SyncSpotify
+
+
+def test_failed_construction_stops_the_loop_thread():
+    before = threading.active_count()
+    with pytest.raises(ValueError):
+        SyncSpotify('token', proxy='http://proxy:3128', transport=object())
+    assert threading.active_count() == before
+    assert not any(thread.name == 'aiospotipy' for thread in threading.enumerate())
@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+from aiospotipy._http import HTTPClient
+from aiospotipy.budget import MemoryBudget
+from aiospotipy.endpoints import CATALOG
+from aiospotipy.tenants import TenantScheduler, tenant
+from aiospotipy.transport import Response
+
+TRACK_ID = '0OdUWJ0sBjDrqHygGUXeCF'
+BODY = json.dumps({'id': TRACK_ID}).encode()
+
+
+class StubTransport:
+    async def request(self, method, url, headers, params=None, data=None, timeout=None, on_headers=None):
+        await asyncio.sleep(0.01)
+        return Response(200, {}, BODY, len(BODY), 'utf-8')
+
+    async def close(self):
+        pass
+
+
+def test_tenant_over_quota_holds_no_budget():
+    async def run():
+        estimate = 64 * 2 ** 10
+        http = HTTPClient('token', transport=StubTransport(),
+                          memory_budget=MemoryBudget(3 * estimate, default_estimate=estimate),
+                          tenants=TenantScheduler({'a': {'rate': 1, 'per': 5}}))
+        route = CATALOG['track'].route(TRACK_ID)
+
+        async def send(name):
+            with tenant(name):
+                return await http.request(route)
+
+        queued = [asyncio.ensure_future(send('a')) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        assert (await asyncio.wait_for(send('b'), 1))['id'] == TRACK_ID
+        for task in queued:
+            task.cancel()
+        await asyncio.gather(*queued, return_exceptions=True)
+        await http.close()
+
+    asyncio.run(run())
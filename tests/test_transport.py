@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from aiospotipy._http import HTTPClient
+
+httpx = pytest.importorskip('httpx')
+
+from aiospotipy.transport import HTTPXTransport  # noqa: E402
+
+
+def mock(delay=0):
+    async def handler(request):
+        await asyncio.sleep(delay)
+        body = json.dumps({'timeout': request.extensions['timeout']}).encode()
+        return httpx.Response(200, stream=httpx.ByteStream(body))
+    return httpx.MockTransport(handler)
+
+
+def test_client_timeout_maps_to_httpx_timeout():
+    async def run():
+        transport = HTTPXTransport(http2=False, transport=mock())
+        timeout = aiohttp.ClientTimeout(total=10, connect=2, sock_connect=1, sock_read=5)
+        r = await transport.request('GET', 'https://api.spotify.com/v1/me', {}, timeout=timeout)
+        await transport.close()
+        return r
+
+    r = asyncio.run(run())
+    assert b'"connect": 1' in r.body and b'"read": 5' in r.body and b'"pool": 2' in r.body
+
+
+def test_total_timeout_raises_timeout_error():
+    async def run():
+        transport = HTTPXTransport(http2=False, transport=mock(delay=1))
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await transport.request('GET', 'https://api.spotify.com/v1/me', {},
+                                        timeout=aiohttp.ClientTimeout(total=0.05))
+            assert not asyncio.current_task().cancelled()
+        finally:
+            await transport.close()
+
+    asyncio.run(run())
+
+
+def test_default_transport_options_are_rejected():
+    async def run():
+        transport = HTTPXTransport(http2=False, transport=mock())
+        try:
+            with pytest.raises(ValueError):
+                HTTPClient('token', proxy='http://proxy:3128', transport=transport)
+        finally:
+            await transport.close()
+
+    asyncio.run(run())